@@ -42,14 +42,15 @@ async def main():
         auth_adapter.validate_configuration()
         print("✅ Authentication configured successfully")
         
-        notion_adapter = NotionPageRepositoryAdapter(auth_adapter)
-        app_service = PageApplicationService(notion_adapter)
-        print("✅ Services initialized")
-        
-        # 2. Create a new page
-        print("\n2. Creating a new page...")
-        page_title = "Demo Page - PARA Framework MVP"
-        page_content = """This is a demo page created by the PARA Framework Notion API MVP.
+        # The adapter closes its connection pool when the block exits
+        async with NotionPageRepositoryAdapter(auth_adapter) as notion_adapter:
+            app_service = PageApplicationService(notion_adapter)
+            print("✅ Services initialized")
+            
+            # 2. Create a new page
+            print("\n2. Creating a new page...")
+            page_title = "Demo Page - PARA Framework MVP"
+            page_content = """This is a demo page created by the PARA Framework Notion API MVP.
 
 Features demonstrated:
 - ✅ Page creation with title and content
@@ -58,78 +59,78 @@ Features demonstrated:
 - ✅ Domain-driven design principles
 
 This page will be updated and then deleted as part of the demo."""
-        
-        created_page = await app_service.create_page(
-            title=page_title,
-            content=page_content,
-            metadata={"demo": True, "framework": "PARA"}
-        )
-        
-        print(f"✅ Page created successfully!")
-        print(f"   ID: {created_page.id}")
-        print(f"   Title: {created_page.title}")
-        print(f"   Content length: {len(created_page.content)} characters")
-        print(f"   Created at: {created_page.created_at}")
-        
-        # 3. Read the created page
-        print("\n3. Reading the created page...")
-        retrieved_page = await app_service.get_page(created_page.id)
-        
-        print(f"✅ Page retrieved successfully!")
-        print(f"   Title: {retrieved_page.title}")
-        print(f"   Updated at: {retrieved_page.updated_at}")
-        print(f"   Has content: {'Yes' if retrieved_page.content else 'No'}")
-        
-        # 4. Update the page
-        print("\n4. Updating the page...")
-        updated_title = f"{page_title} - Updated"
-        updated_content = f"{page_content}\n\n--- UPDATE ---\nThis content was added during the demo update operation."
-        
-        updated_page = await app_service.update_page(
-            page_id=created_page.id,
-            title=updated_title,
-            content=updated_content
-        )
-        
-        print(f"✅ Page updated successfully!")
-        print(f"   New title: {updated_page.title}")
-        print(f"   New content length: {len(updated_page.content)} characters")
-        
-        # 5. List pages (show first few)
-        print("\n5. Listing pages in workspace...")
-        pages = await app_service.list_pages(limit=5)
-        print(f"✅ Found {len(pages)} pages (showing up to 5):")
-        for i, page in enumerate(pages, 1):
-            print(f"   {i}. {page.title[:50]}..." if len(page.title) > 50 else f"   {i}. {page.title}")
-        
-        # 6. Check page existence
-        print("\n6. Checking page existence...")
-        exists = await app_service.page_exists(created_page.id)
-        print(f"✅ Page exists: {exists}")
-        
-        # 7. Delete the page
-        print("\n7. Cleaning up - deleting the demo page...")
-        deleted = await app_service.delete_page(created_page.id)
-        
-        if deleted:
-            print("✅ Page deleted successfully!")
             
-            # Verify deletion
-            exists_after_delete = await app_service.page_exists(created_page.id)
-            print(f"   Page exists after deletion: {exists_after_delete}")
-        else:
-            print("❌ Page deletion failed or page did not exist")
-        
-        print("\n🎉 Demo completed successfully!")
-        print("\nThe Notion API MVP is working correctly with the following features:")
-        print("  ✅ Create pages with title and content")
-        print("  ✅ Read pages by ID")
-        print("  ✅ Update existing pages")
-        print("  ✅ Delete pages")
-        print("  ✅ List pages with pagination")
-        print("  ✅ Check page existence")
-        print("  ✅ Proper error handling and validation")
-        print("  ✅ Clean hexagonal architecture implementation")
+            created_page = await app_service.create_page(
+                title=page_title,
+                content=page_content,
+                metadata={"demo": True, "framework": "PARA"}
+            )
+            
+            print(f"✅ Page created successfully!")
+            print(f"   ID: {created_page.id}")
+            print(f"   Title: {created_page.title}")
+            print(f"   Content length: {len(created_page.content)} characters")
+            print(f"   Created at: {created_page.created_at}")
+            
+            # 3. Read the created page
+            print("\n3. Reading the created page...")
+            retrieved_page = await app_service.get_page(created_page.id)
+            
+            print(f"✅ Page retrieved successfully!")
+            print(f"   Title: {retrieved_page.title}")
+            print(f"   Updated at: {retrieved_page.updated_at}")
+            print(f"   Has content: {'Yes' if retrieved_page.content else 'No'}")
+            
+            # 4. Update the page
+            print("\n4. Updating the page...")
+            updated_title = f"{page_title} - Updated"
+            updated_content = f"{page_content}\n\n--- UPDATE ---\nThis content was added during the demo update operation."
+            
+            updated_page = await app_service.update_page(
+                page_id=created_page.id,
+                title=updated_title,
+                content=updated_content
+            )
+            
+            print(f"✅ Page updated successfully!")
+            print(f"   New title: {updated_page.title}")
+            print(f"   New content length: {len(updated_page.content)} characters")
+            
+            # 5. List pages (show first few)
+            print("\n5. Listing pages in workspace...")
+            pages = await app_service.list_pages(limit=5)
+            print(f"✅ Found {len(pages)} pages (showing up to 5):")
+            for i, page in enumerate(pages, 1):
+                print(f"   {i}. {page.title[:50]}..." if len(page.title) > 50 else f"   {i}. {page.title}")
+            
+            # 6. Check page existence
+            print("\n6. Checking page existence...")
+            exists = await app_service.page_exists(created_page.id)
+            print(f"✅ Page exists: {exists}")
+            
+            # 7. Delete the page
+            print("\n7. Cleaning up - deleting the demo page...")
+            deleted = await app_service.delete_page(created_page.id)
+            
+            if deleted:
+                print("✅ Page deleted successfully!")
+                
+                # Verify deletion
+                exists_after_delete = await app_service.page_exists(created_page.id)
+                print(f"   Page exists after deletion: {exists_after_delete}")
+            else:
+                print("❌ Page deletion failed or page did not exist")
+            
+            print("\n🎉 Demo completed successfully!")
+            print("\nThe Notion API MVP is working correctly with the following features:")
+            print("  ✅ Create pages with title and content")
+            print("  ✅ Read pages by ID")
+            print("  ✅ Update existing pages")
+            print("  ✅ Delete pages")
+            print("  ✅ List pages with pagination")
+            print("  ✅ Check page existence")
+            print("  ✅ Proper error handling and validation")
+            print("  ✅ Clean hexagonal architecture implementation")
         
     except Exception as e:
         print(f"\n❌ Demo failed with error: {e}")
@@ -6,6 +6,7 @@ property schema definitions in Notion databases.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any
 
 from .property_types import PropertyType
@@ -60,6 +61,42 @@ class DatabaseProperty:
                     f"{self.property_type.value} property requires at least one option"
                 )
 
+    @classmethod
+    def intern(
+        cls, name: str, property_type: PropertyType, is_required: bool = False
+    ) -> "DatabaseProperty":
+        """
+        Return a shared, already-validated property that needs no config.
+
+        Equal arguments return the same instance whether they are passed
+        by position or by keyword, so repeated schema definitions (e.g. the
+        TITLE property) skip re-validation. Instances are shared, so their
+        config must not be mutated.
+
+        Args:
+            name: The property name
+            property_type: The type of this property
+            is_required: Whether this property must have a value in pages
+
+        Returns:
+            Interned DatabaseProperty instance
+
+        Raises:
+            ValueError: If the property is invalid without config
+                (e.g. SELECT without options)
+        """
+        # lru_cache keys positional and keyword calls differently, so the
+        # cached constructor is always called positionally
+        return cls._interned(name, property_type, is_required)
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _interned(
+        cls, name: str, property_type: PropertyType, is_required: bool
+    ) -> "DatabaseProperty":
+        """Build and cache the property behind intern()."""
+        return cls(name=name, property_type=property_type, is_required=is_required)
+
     def to_notion_format(self) -> Dict[str, Any]:
         """
         Convert property schema to Notion API format.
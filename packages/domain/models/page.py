@@ -34,7 +34,11 @@ class Page:
     
     def is_empty(self) -> bool:
         """Check if the page has no content."""
-        return not self.title.strip() and not self.content.strip()
+        # isspace() answers without copying the text the way strip() does
+        return (
+            (not self.title or self.title.isspace())
+            and (not self.content or self.content.isspace())
+        )
     
     def has_id(self) -> bool:
         """Check if the page has been persisted (has an ID)."""
@@ -0,0 +1,26 @@
+"""
+Shared fixtures for domain unit tests.
+
+Provides the minimal valid schema objects that most Database and
+DatabaseProperty tests build on.
+"""
+
+import pytest
+from packages.domain.models.database import Database
+from packages.domain.models.database_property import DatabaseProperty
+from packages.domain.models.property_types import PropertyType
+
+
+@pytest.fixture
+def minimal_title_property():
+    """Fixture providing the single TITLE property every database needs."""
+    return DatabaseProperty.intern(name="Name", property_type=PropertyType.TITLE)
+
+
+@pytest.fixture
+def minimal_database(minimal_title_property):
+    """Fixture providing a valid database with only a TITLE property."""
+    return Database(
+        title="Test DB",
+        properties={"Name": minimal_title_property}
+    )
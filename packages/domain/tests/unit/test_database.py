@@ -4,13 +4,29 @@ Unit tests for Database entity.
 Tests business logic, validation rules, and methods of the Database entity.
 """
 
+import re
 import pytest
+from dataclasses import FrozenInstanceError, replace
 from datetime import datetime
+from types import MappingProxyType
 from packages.domain.models.database import Database
 from packages.domain.models.database_property import DatabaseProperty
 from packages.domain.models.property_types import PropertyType
 
 
+# DatabaseProperty is frozen, so one TITLE property can back every test
+_TITLE_PROP = DatabaseProperty.intern(name="Name", property_type=PropertyType.TITLE)
+_MIN_PROPS = MappingProxyType({"Name": _TITLE_PROP})
+
+_CREATED_AT = datetime(2025, 10, 2, 10, 0, 0)
+_UPDATED_AT = datetime(2025, 10, 2, 11, 0, 0)
+
+# Expected validation messages, compiled once for pytest.raises(match=...)
+_ERR_TITLE_EMPTY = re.compile("title cannot be empty")
+_ERR_NO_PROPERTIES = re.compile("at least one property")
+_ERR_ONE_TITLE = re.compile("exactly one TITLE property")
+
+
 class TestDatabaseEntity:
     """Unit tests for Database entity."""
 
@@ -19,12 +35,7 @@ class TestDatabaseEntity:
         # Arrange & Act
         database = Database(
             title="Test DB",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                )
-            }
+            properties=dict(_MIN_PROPS)
         )
 
         # Assert
@@ -36,10 +47,6 @@ class TestDatabaseEntity:
 
     def test_create_database_with_all_fields(self):
         """Test creating database with all fields populated."""
-        # Arrange
-        created_at = datetime(2025, 10, 2, 10, 0, 0)
-        updated_at = datetime(2025, 10, 2, 11, 0, 0)
-
         # Act
         database = Database(
             id="db-123",
@@ -56,8 +63,8 @@ class TestDatabaseEntity:
                 )
             },
             parent_id="parent-page-456",
-            created_at=created_at,
-            updated_at=updated_at,
+            created_at=_CREATED_AT,
+            updated_at=_UPDATED_AT,
             metadata={"url": "https://notion.so/db-123"}
         )
 
@@ -67,123 +74,57 @@ class TestDatabaseEntity:
         assert database.description == "Complete database"
         assert len(database.properties) == 2
         assert database.parent_id == "parent-page-456"
-        assert database.created_at == created_at
-        assert database.updated_at == updated_at
+        assert database.created_at == _CREATED_AT
+        assert database.updated_at == _UPDATED_AT
         assert database.metadata["url"] == "https://notion.so/db-123"
 
-    def test_validates_title_required(self):
-        """Test that empty title raises ValueError."""
-        with pytest.raises(ValueError, match="title cannot be empty"):
-            Database(
-                title="",
-                properties={
-                    "Name": DatabaseProperty(
-                        name="Name",
-                        property_type=PropertyType.TITLE
-                    )
-                }
-            )
-
-    def test_validates_title_not_whitespace_only(self):
-        """Test that whitespace-only title raises ValueError."""
-        with pytest.raises(ValueError, match="title cannot be empty"):
-            Database(
-                title="   ",
-                properties={
-                    "Name": DatabaseProperty(
-                        name="Name",
-                        property_type=PropertyType.TITLE
-                    )
-                }
-            )
-
-    def test_validates_at_least_one_property(self):
-        """Test that database without properties raises ValueError."""
-        with pytest.raises(ValueError, match="at least one property"):
-            Database(
-                title="No Props",
-                properties={}
-            )
-
-    def test_validates_exactly_one_title_property(self):
-        """Test that database must have exactly one TITLE property."""
-        # No TITLE property
-        with pytest.raises(ValueError, match="exactly one TITLE property"):
-            Database(
-                title="No Title Prop",
-                properties={
+    @pytest.mark.parametrize(
+        "title, properties, pattern",
+        [
+            ("", _MIN_PROPS, _ERR_TITLE_EMPTY),
+            ("   ", _MIN_PROPS, _ERR_TITLE_EMPTY),
+            ("No Props", {}, _ERR_NO_PROPERTIES),
+            (
+                "Title Count",
+                {
                     "Notes": DatabaseProperty(
                         name="Notes",
                         property_type=PropertyType.RICH_TEXT
                     )
-                }
-            )
-
-        # Multiple TITLE properties
-        with pytest.raises(ValueError, match="exactly one TITLE property"):
-            Database(
-                title="Two Titles",
-                properties={
-                    "Name": DatabaseProperty(
-                        name="Name",
-                        property_type=PropertyType.TITLE
-                    ),
+                },
+                _ERR_ONE_TITLE
+            ),
+            (
+                "Title Count",
+                {
+                    "Name": _TITLE_PROP,
                     "Title": DatabaseProperty(
                         name="Title",
                         property_type=PropertyType.TITLE
                     )
-                }
+                },
+                _ERR_ONE_TITLE
             )
-
-    def test_has_id_returns_false_when_no_id(self):
-        """Test has_id() returns False for new database."""
-        # Arrange
-        database = Database(
-            title="New DB",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                )
-            }
-        )
-
-        # Assert
-        assert database.has_id() is False
-
-    def test_has_id_returns_false_for_empty_id(self):
-        """Test has_id() returns False for empty string ID."""
-        # Arrange
-        database = Database(
-            id="",
-            title="Empty ID",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                )
-            }
-        )
-
-        # Assert
-        assert database.has_id() is False
-
-    def test_has_id_returns_true_when_id_present(self):
-        """Test has_id() returns True for persisted database."""
+        ],
+        ids=["empty_title", "whitespace_title", "no_properties", "no_title", "two_titles"]
+    )
+    def test_constructor_validation_errors(self, title, properties, pattern):
+        """Test that each invalid construction raises the matching ValueError."""
+        with pytest.raises(ValueError, match=pattern):
+            Database(title=title, properties=dict(properties))
+
+    @pytest.mark.parametrize(
+        "database_id, expected",
+        [(None, False), ("", False), ("db-456", True)],
+        ids=["no_id", "empty_id", "persisted"]
+    )
+    def test_has_id(self, minimal_database, database_id, expected):
+        """Test has_id() reports whether the database has been persisted."""
         # Arrange
-        database = Database(
-            id="db-456",
-            title="Persisted DB",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                )
-            }
-        )
+        database = replace(minimal_database, id=database_id)
 
         # Assert
-        assert database.has_id() is True
+        assert database.has_id() is expected
 
     def test_is_valid_returns_true_for_valid_database(self):
         """Test is_valid() returns True for valid database."""
@@ -191,10 +132,7 @@ class TestDatabaseEntity:
         database = Database(
             title="Valid DB",
             properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                ),
+                "Name": _TITLE_PROP,
                 "Status": DatabaseProperty(
                     name="Status",
                     property_type=PropertyType.SELECT,
@@ -229,76 +167,38 @@ class TestDatabaseEntity:
         # Assert
         assert title_prop_name == "Task Name"
 
+    @pytest.mark.skip(
+        reason="Cannot create database without TITLE property due to validation"
+    )
     def test_get_title_property_name_returns_none_when_no_title(self):
         """Test get_title_property_name() returns None if no TITLE property."""
-        # This should not be possible with validation, but test the method
-        # Arrange - We can't actually create this through normal means
-        # So this tests the method's robustness
-
-        # Since validation prevents this, skip or test the method directly
-        pytest.skip("Cannot create database without TITLE property due to validation")
 
     def test_database_is_frozen_dataclass(self):
         """Test that Database is immutable (frozen dataclass)."""
         # Arrange
         database = Database(
             title="Frozen DB",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                )
-            }
+            properties=dict(_MIN_PROPS)
         )
 
         # Act & Assert - Attempting to modify should raise error
-        with pytest.raises(Exception):  # FrozenInstanceError or AttributeError
+        with pytest.raises(FrozenInstanceError):
             database.title = "Modified"
 
-    def test_str_representation_without_id(self):
-        """Test string representation for database without ID."""
+    @pytest.mark.parametrize(
+        "database_id, expected_id_str",
+        [(None, "id=None"), ("db-789", "id=db-789")],
+        ids=["without_id", "with_id"]
+    )
+    def test_str_representation(self, minimal_database, database_id, expected_id_str):
+        """Test string representation for new and persisted databases."""
         # Arrange
-        database = Database(
-            title="Test DB",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                )
-            }
-        )
+        database = replace(minimal_database, id=database_id)
 
         # Act
         str_repr = str(database)
 
         # Assert
-        assert "id=None" in str_repr
+        assert expected_id_str in str_repr
         assert "Test DB" in str_repr
         assert "properties=1" in str_repr
-
-    def test_str_representation_with_id(self):
-        """Test string representation for persisted database."""
-        # Arrange
-        database = Database(
-            id="db-789",
-            title="Persisted DB",
-            properties={
-                "Name": DatabaseProperty(
-                    name="Name",
-                    property_type=PropertyType.TITLE
-                ),
-                "Tags": DatabaseProperty(
-                    name="Tags",
-                    property_type=PropertyType.MULTI_SELECT,
-                    config={"options": [{"name": "urgent"}]}
-                )
-            }
-        )
-
-        # Act
-        str_repr = str(database)
-
-        # Assert
-        assert "id=db-789" in str_repr
-        assert "Persisted DB" in str_repr
-        assert "properties=2" in str_repr
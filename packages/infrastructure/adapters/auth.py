@@ -7,8 +7,14 @@ and secure credential management.
 """
 
 import os
-from typing import Optional
-from dotenv import load_dotenv
+from typing import Optional, Set, Tuple
+
+
+# (resolved path, mtime) of every .env file already loaded in this process
+_DOTENV_LOADED: Set[Tuple[str, float]] = set()
+
+# Settings a .env file would provide; if all are set, the lookup is skipped
+_NOTION_ENV_KEYS = ('NOTION_TOKEN', 'NOTION_DATABASE_ID')
 
 
 class AuthenticationAdapter:
@@ -26,10 +32,50 @@ class AuthenticationAdapter:
         Args:
             env_file: Path to .env file. If None, uses default .env lookup
         """
-        if env_file:
-            load_dotenv(env_file)
-        else:
-            load_dotenv()
+        self._load_env_file(env_file)
+        
+        # Credentials are read from the environment once and then memoized
+        self._token: Optional[str] = None
+        self._database_id: Optional[str] = None
+        self._database_id_loaded = False
+    
+    @staticmethod
+    def _load_env_file(env_file: Optional[str]) -> None:
+        """
+        Load a .env file into the environment once per process.
+        
+        A file is parsed again only if it has been modified since it was
+        last loaded, so constructing many adapters costs a single stat().
+        
+        Args:
+            env_file: Path to .env file. If None, uses default .env lookup
+        """
+        if not env_file and all(os.environ.get(key) for key in _NOTION_ENV_KEYS):
+            # Already configured (containers, CI): skip importing dotenv entirely
+            return
+        
+        from dotenv import find_dotenv, load_dotenv
+        
+        path = env_file or find_dotenv()
+        if not path:
+            return
+        
+        try:
+            resolved = os.path.realpath(path)
+            key = (resolved, os.stat(resolved).st_mtime)
+        except OSError:
+            return
+        
+        if key in _DOTENV_LOADED:
+            return
+        
+        load_dotenv(resolved)
+        _DOTENV_LOADED.add(key)
+    
+    @classmethod
+    def clear_dotenv_cache(cls) -> None:
+        """Forget loaded .env files so the next instance reloads them (for tests)."""
+        _DOTENV_LOADED.clear()
     
     def get_notion_token(self) -> str:
         """
@@ -41,13 +87,17 @@ class AuthenticationAdapter:
         Raises:
             ValueError: If token is not found or empty
         """
-        token = os.getenv('NOTION_TOKEN')
-        if not token or not token.strip():
+        if self._token is not None:
+            return self._token
+        
+        token = (os.environ.get('NOTION_TOKEN') or '').strip()
+        if not token:
             raise ValueError(
                 "NOTION_TOKEN environment variable is required. "
                 "Please set it to your Notion integration token."
             )
-        return token.strip()
+        self._token = token
+        return token
     
     def get_notion_database_id(self) -> Optional[str]:
         """
@@ -56,8 +106,17 @@ class AuthenticationAdapter:
         Returns:
             Notion database ID if configured, None otherwise
         """
-        database_id = os.getenv('NOTION_DATABASE_ID')
-        return database_id.strip() if database_id else None
+        if not self._database_id_loaded:
+            database_id = os.environ.get('NOTION_DATABASE_ID')
+            self._database_id = database_id.strip() if database_id else None
+            self._database_id_loaded = True
+        return self._database_id
+    
+    def invalidate(self) -> None:
+        """Drop memoized credentials so they are re-read from the environment."""
+        self._token = None
+        self._database_id = None
+        self._database_id_loaded = False
     
     def validate_configuration(self) -> bool:
         """
@@ -69,8 +128,4 @@ class AuthenticationAdapter:
         Raises:
             ValueError: If required configuration is missing
         """
-        try:
-            self.get_notion_token()
-            return True
-        except ValueError as e:
-            raise ValueError(f"Configuration validation failed: {e}")
\ No newline at end of file
+        return bool(self.get_notion_token())
\ No newline at end of file
@@ -0,0 +1,79 @@
+"""
+Small in-process caches used by the infrastructure adapters.
+
+Entries expire after a fixed time-to-live and the least recently used
+entry is evicted once the cache is full.
+"""
+
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """
+    Bounded LRU cache whose entries expire after ``ttl`` seconds.
+
+    A ``ttl`` of 0 disables caching entirely.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        maxsize: int = 256,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays fresh; 0 disables caching
+            maxsize: Maximum number of entries kept
+            clock: Monotonic time source, overridable for tests
+        """
+        if ttl < 0:
+            raise ValueError("ttl cannot be negative")
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, Tuple[float, V]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the fresh value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if self._clock() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if not self.ttl:
+            return
+
+        self._entries[key] = (self._clock() + self.ttl, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop the entry for key, if any."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
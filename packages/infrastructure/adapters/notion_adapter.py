@@ -7,9 +7,24 @@ and data mapping between domain entities and Notion API formats.
 """
 
 import asyncio
-from datetime import datetime
-from typing import List, Optional, Dict, Any
-from notion_client import Client as NotionClient
+import inspect
+import random
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import cached_property, wraps
+from types import MappingProxyType
+from typing import (
+    Any, AsyncIterator, Awaitable, Callable, Dict, Iterator, List, Mapping, Optional, Type,
+    TypeVar, Union, cast
+)
+import httpx
+from notion_client import AsyncClient
+from typing_extensions import Concatenate, ParamSpec
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the "speedups" extra
+    orjson = None
 from notion_client.errors import HTTPResponseError, APIResponseError, RequestTimeoutError
 
 from ...domain.models.page import Page
@@ -18,14 +33,289 @@ from ...domain.models.database_property import DatabaseProperty
 from ...domain.models.property_types import PropertyType
 from ...domain.ports.page_repository import PageRepositoryPort
 from ...domain.exceptions import (
+    DomainError,
+    PageError,
+    DatabaseError,
     PageCreationError,
     PageUpdateError,
     PageDeletionError,
     PageRetrievalError,
     PageNotFoundError,
+    DatabaseCreationError,
+    DatabaseUpdateError,
+    DatabaseDeletionError,
+    DatabaseRetrievalError,
+    DatabaseNotFoundError,
     ValidationError
 )
 from .auth import AuthenticationAdapter
+from .cache import TTLCache
+from .rate_limit import NotionRateLimiter, parse_retry_after
+
+
+# Connection pool shared by every request an adapter makes to api.notion.com
+_HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=32,
+    max_connections=64,
+    keepalive_expiry=60
+)
+
+# Request timeout; notion-client applies it, and the base URL, to the pool
+_HTTP_TIMEOUT_MS = 30_000
+
+
+class _NotionHTTPClient(httpx.AsyncClient):
+    """httpx client that encodes JSON request bodies with orjson when installed."""
+
+    def build_request(
+        self,
+        method: str,
+        url: Union[httpx.URL, str],
+        *,
+        json: Any = None,
+        **kwargs: Any
+    ) -> httpx.Request:
+        if json is not None and orjson is not None and kwargs.get("content") is None:
+            try:
+                content = orjson.dumps(json)
+            except orjson.JSONEncodeError:
+                # Payloads orjson rejects (e.g. non-str keys) go through httpx's json
+                pass
+            else:
+                headers = httpx.Headers(kwargs.pop("headers", None))
+                headers["Content-Type"] = "application/json"
+                return super().build_request(
+                    method, url, content=content, headers=headers, **kwargs
+                )
+        return super().build_request(method, url, json=json, **kwargs)
+
+# Largest page_size Notion accepts for list endpoints
+_MAX_PAGE_SIZE = 100
+
+# Default number of page fetches kept in flight when listing pages
+_DEFAULT_MAX_CONCURRENCY = 10
+
+# Default seconds a fetched page or database is served from cache
+_DEFAULT_CACHE_TTL = 30.0
+
+# Database schemas change rarely, so page creation reuses them for longer
+_SCHEMA_CACHE_TTL = 300.0
+
+# Title property name assumed when a database schema cannot be read
+_DEFAULT_TITLE_PROPERTY = "Name"
+
+# Notion's documented average request budget per integration
+_DEFAULT_REQUESTS_PER_SECOND = 3.0
+
+# Responses worth retrying, and how hard to try. Only 429 guarantees the
+# request was not applied, so it is the only one retried for writes that
+# are not idempotent.
+_RATE_LIMITED_STATUS = 429
+_RETRYABLE_STATUSES = frozenset({429, 500, 502, 503, 504})
+_MAX_ATTEMPTS = 5
+_BASE_BACKOFF = 0.25
+_MAX_BACKOFF = 30.0
+
+# Failures where the request may never have reached Notion: retried like
+# 5xx responses, and reported as Notion errors rather than unexpected ones.
+# notion-client has no connection error of its own; httpx raises those.
+_TRANSIENT_ERRORS = (RequestTimeoutError, httpx.TransportError)
+_NOTION_ERRORS = (HTTPResponseError,) + _TRANSIENT_ERRORS
+
+_UTC = timezone.utc
+
+# String properties with these names are sent as select options
+_SELECT_PROPS = frozenset({"Status", "Priority", "Category"})
+
+# Notion property type string -> PropertyType; unknown types map to RICH_TEXT
+_NOTION_TYPE_TO_ENUM: Mapping[str, PropertyType] = MappingProxyType({
+    "title": PropertyType.TITLE,
+    "rich_text": PropertyType.RICH_TEXT,
+    "number": PropertyType.NUMBER,
+    "select": PropertyType.SELECT,
+    "multi_select": PropertyType.MULTI_SELECT,
+    "date": PropertyType.DATE,
+    "checkbox": PropertyType.CHECKBOX,
+    "url": PropertyType.URL,
+    "email": PropertyType.EMAIL
+})
+
+
+def _extract_property_config(prop_type: PropertyType, prop_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract the DatabaseProperty config from a Notion property schema."""
+    if prop_type is PropertyType.SELECT and "select" in prop_data:
+        return {"options": prop_data["select"].get("options", [])}
+    if prop_type is PropertyType.MULTI_SELECT and "multi_select" in prop_data:
+        return {"options": prop_data["multi_select"].get("options", [])}
+    if prop_type is PropertyType.NUMBER and "format" in prop_data.get("number", {}):
+        return {"format": prop_data["number"]["format"]}
+    return {}
+
+
+def _parse_notion_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a Notion timestamp such as ``2025-10-02T10:00:00.000Z``.
+
+    Notion always sends this fixed UTC format, so it is sliced directly;
+    anything else goes through datetime.fromisoformat.
+    """
+    if not value:
+        return None
+    if len(value) == 24 and value[23] == "Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            int(value[20:23]) * 1000,
+            tzinfo=_UTC
+        )
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _text_segments(text: str) -> List[Dict[str, Any]]:
+    """Wrap text as a single-segment Notion rich text array."""
+    return [{"type": "text", "text": {"content": text}}]
+
+
+def _title_prop(text: str) -> Dict[str, Any]:
+    """Format text as a Notion title property value."""
+    return {"title": _text_segments(text)}
+
+
+def _rich_text_value(text: str) -> Dict[str, Any]:
+    """Format text as a Notion rich_text property value."""
+    return {"rich_text": _text_segments(text)}
+
+
+def _paragraph_block(text: str) -> Dict[str, Any]:
+    """Build a Notion paragraph block holding text."""
+    return {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": _text_segments(text)}
+    }
+
+
+def _format_str_value(prop_name: str, value: str) -> Dict[str, Any]:
+    """Format a string as a select option or rich_text, depending on the name."""
+    # Could be rich_text, select, url, email, etc.
+    # For MVP, treat as select if it looks like a status, otherwise rich_text
+    if prop_name in _SELECT_PROPS:
+        return {"select": {"name": value}}
+    return _rich_text_value(value)
+
+
+# Exact value type -> formatter; bool needs its own entry as it subclasses int
+_PROPERTY_FORMATTERS: Dict[type, Callable[[str, Any], Dict[str, Any]]] = {
+    bool: lambda prop_name, value: {"checkbox": value},
+    int: lambda prop_name, value: {"number": value},
+    float: lambda prop_name, value: {"number": value},
+    str: _format_str_value,
+    # Multi-select
+    list: lambda prop_name, value: {"multi_select": [{"name": v} for v in value]},
+}
+
+
+def _return_none(*args: Any, **kwargs: Any) -> None:
+    """Treat a missing entity as None."""
+    return None
+
+
+def _return_false(*args: Any, **kwargs: Any) -> bool:
+    """Treat a missing entity as nothing to delete."""
+    return False
+
+
+def _raise_page_not_found(page: Page) -> Page:
+    """Report a missing page being updated."""
+    raise PageNotFoundError(page.id)
+
+
+def _raise_database_not_found(database: Database) -> Database:
+    """Report a missing database being updated."""
+    raise DatabaseNotFoundError(database.id)
+
+
+_SelfT = TypeVar("_SelfT")
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+def _translate_errors(
+    error_cls: Type[DomainError],
+    failure: str,
+    action: str,
+    not_found: Optional[Callable[..., Any]] = None
+) -> Callable[
+    [Callable[Concatenate[_SelfT, _P], _R]],
+    Callable[Concatenate[_SelfT, _P], _R]
+]:
+    """
+    Translate failures escaping an adapter method into domain exceptions.
+
+    Notion API, timeout and transport errors become
+    ``error_cls("<failure>: ...")``; any other unexpected exception becomes
+    ``error_cls("Unexpected error during <action>: ...")``. ValidationError
+    and errors of error_cls's own family (PageError or DatabaseError)
+    propagate unchanged; other domain errors, raised by a nested lookup,
+    are wrapped like Notion errors so callers only see the errors the
+    port declares. Works on coroutine methods and async generator
+    methods alike.
+
+    Args:
+        error_cls: Domain exception raised on failure
+        failure: Message prefix for Notion errors
+        action: Operation name for unexpected errors
+        not_found: Called with the method's arguments when Notion answers
+                   404; its return value becomes the method's result.
+                   Not supported for async generators.
+    """
+    family = next(
+        (base for base in (PageError, DatabaseError) if issubclass(error_cls, base)),
+        error_cls
+    )
+
+    def translate(e: Exception) -> Exception:
+        if isinstance(e, (ValidationError, family)):
+            return e
+        if isinstance(e, (DomainError,) + _NOTION_ERRORS):
+            return error_cls(f"{failure}: {str(e)}")
+        return error_cls(f"Unexpected error during {action}: {str(e)}")
+
+    def decorator(
+        method: Callable[Concatenate[_SelfT, _P], _R]
+    ) -> Callable[Concatenate[_SelfT, _P], _R]:
+        if inspect.isasyncgenfunction(method):
+            iterate = cast(Callable[..., AsyncIterator[Any]], method)
+
+            @wraps(method)
+            async def generator_wrapper(
+                self: _SelfT, *args: _P.args, **kwargs: _P.kwargs
+            ) -> AsyncIterator[Any]:
+                try:
+                    async for item in iterate(self, *args, **kwargs):
+                        yield item
+                except Exception as e:
+                    error = translate(e)
+                    if error is e:
+                        raise
+                    raise error
+            return cast(Callable[Concatenate[_SelfT, _P], _R], generator_wrapper)
+
+        call = cast(Callable[..., Awaitable[Any]], method)
+
+        @wraps(method)
+        async def wrapper(self: _SelfT, *args: _P.args, **kwargs: _P.kwargs) -> Any:
+            try:
+                return await call(self, *args, **kwargs)
+            except Exception as e:
+                if isinstance(e, APIResponseError) and e.status == 404 and not_found is not None:
+                    return not_found(*args, **kwargs)
+                error = translate(e)
+                if error is e:
+                    raise
+                raise error
+        return cast(Callable[Concatenate[_SelfT, _P], _R], wrapper)
+    return decorator
 
 
 class NotionPageRepositoryAdapter(PageRepositoryPort):
@@ -37,21 +327,117 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
     the interface contract defined by the port.
     """
     
-    def __init__(self, auth_adapter: Optional[AuthenticationAdapter] = None):
+    def __init__(
+        self,
+        auth_adapter: Optional[AuthenticationAdapter] = None,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
+        requests_per_second: float = _DEFAULT_REQUESTS_PER_SECOND,
+        http2: bool = False,
+        parent_page_id: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize the Notion adapter.
         
+        The adapter owns a keep-alive HTTP connection pool, so create it once
+        and reuse it for the lifetime of the application; call ``aclose()``
+        when done, or use the adapter as an ``async with`` block.
+
         Args:
             auth_adapter: Authentication adapter for credential management.
                          If None, creates a new instance.
+            max_concurrency: Maximum number of pages fetched concurrently
+                             by list_pages and query_database_pages.
+            cache_ttl: Seconds a fetched page or database is reused before
+                       asking Notion again. 0 disables caching.
+            requests_per_second: Client-side cap on Notion requests started
+                                 per second.
+            http2: Multiplex concurrent requests over one HTTP/2 connection
+                   instead of a pool of HTTP/1.1 ones. Needs the ``http2``
+                   extra (``pip install paraflow[http2]``).
+            parent_page_id: Page new standalone pages are created under.
+                            If None, uses NOTION_DATABASE_ID.
+            http_client: Connection pool to send requests through, shared
+                         with other adapters. Its owner closes it; http2
+                         is then ignored. notion-client replaces the pool's
+                         base URL, headers and timeout, so only share it
+                         with other Notion adapters. Each request carries
+                         its adapter's token, so their tokens may differ.
         """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
         self.auth_adapter = auth_adapter or AuthenticationAdapter()
         self.auth_adapter.validate_configuration()
+        self.max_concurrency = max_concurrency
+        self._parent_page_id = parent_page_id
+        self._page_cache: TTLCache[Page] = TTLCache(cache_ttl)
+        self._database_cache: TTLCache[Database] = TTLCache(cache_ttl)
+        self._title_property_cache: TTLCache[str] = TTLCache(
+            _SCHEMA_CACHE_TTL if cache_ttl else 0
+        )
+        self._limiter = NotionRateLimiter(requests_per_second)
+        # Backoff between retries; replaced in tests so they never wait
+        self._sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+        
+        # Initialize Notion client (httpx-based, awaited natively). The token
+        # is sent with every call rather than set on the pool's headers,
+        # which adapters sharing the pool would overwrite.
+        self._token = self.auth_adapter.get_notion_token()
+        self._owns_http_client = http_client is None
+        self._http_client = http_client or _NotionHTTPClient(
+            limits=_HTTP_LIMITS,
+            http2=http2
+        )
+        self.client = AsyncClient(
+            client=self._http_client,
+            timeout_ms=_HTTP_TIMEOUT_MS
+        )
+    
+    async def __aenter__(self) -> "NotionPageRepositoryAdapter":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool, unless it was injected."""
+        if self._owns_http_client:
+            await self._http_client.aclose()
+    
+    def invalidate(self, entity_id: Optional[str] = None) -> None:
+        """
+        Drop cached pages and databases.
         
-        # Initialize Notion client
-        token = self.auth_adapter.get_notion_token()
-        self.client = NotionClient(auth=token)
+        Args:
+            entity_id: Page or database ID to forget. If None, clears everything.
+        """
+        if entity_id is None:
+            self._page_cache.clear()
+            self._database_cache.clear()
+            self._title_property_cache.clear()
+        else:
+            self._page_cache.invalidate(entity_id)
+            self._database_cache.invalidate(entity_id)
+            self._title_property_cache.invalidate(entity_id)
     
+    @contextmanager
+    def _writing(self, entity_id: str) -> Iterator[None]:
+        """
+        Forget an entity's cached state around a write to it.
+        
+        Dropping it again afterwards, whether or not the write succeeded,
+        stops a read that was in flight during the write from keeping
+        pre-write state cached for a whole TTL.
+        """
+        self.invalidate(entity_id)
+        try:
+            yield
+        finally:
+            self.invalidate(entity_id)
+    
+    @_translate_errors(PageCreationError, "Failed to create page in Notion", "page creation")
     async def create_page(self, page: Page) -> Page:
         """
         Create a new page in Notion.
@@ -69,47 +455,52 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
             PageCreationError: If page creation fails
             ValidationError: If page data is invalid
         """
-        try:
-            if page.has_id():
-                raise ValidationError("Page already has an ID. Use update_page instead.")
+        if page.has_id():
+            raise ValidationError("Page already has an ID. Use update_page instead.")
 
-            if page.is_empty():
-                raise ValidationError("Page must have either title or content.")
+        if page.is_empty():
+            raise ValidationError("Page must have either title or content.")
 
-            # Check if this is a database page
-            parent_database_id = page.metadata.get("parent_database_id") if page.metadata else None
+        # Check if this is a database page
+        parent_database_id = page.metadata.get("parent_database_id") if page.metadata else None
 
-            if parent_database_id:
-                # Creating page in a database
-                properties = self._build_database_page_properties(page)
-                parent = {"type": "database_id", "database_id": parent_database_id}
-            else:
-                # Creating standalone page
-                properties = self._build_page_properties(page)
-                parent = {"type": "page_id", "page_id": self._get_parent_page_id()}
-
-            # Create page content (children blocks)
-            children = self._build_page_children(page)
-
-            # Make API call to create page
-            response = await self._run_sync(
-                self.client.pages.create,
-                parent=parent,
-                properties=properties,
-                children=children
-            )
+        if parent_database_id:
+            # Creating page in a database
+            title_property = await self._get_title_property(parent_database_id)
+            properties = self._build_database_page_properties(page, title_property)
+            parent = {"type": "database_id", "database_id": parent_database_id}
+        else:
+            # Creating standalone page
+            properties = self._build_page_properties(page)
+            parent = self._page_parent
+
+        # Create page content (children blocks)
+        children = self._build_page_children(page)
 
-            return self._map_notion_response_to_page(response)
+        # Make API call to create page
+        response = await self._call(
+            self.client.pages.create,
+            idempotent=False,
+            parent=parent,
+            properties=properties,
+            children=children
+        )
 
-        except (HTTPResponseError, APIResponseError, RequestTimeoutError) as e:
-            raise PageCreationError(f"Failed to create page in Notion: {str(e)}")
-        except Exception as e:
-            raise PageCreationError(f"Unexpected error during page creation: {str(e)}")
+        # The page holds exactly what was submitted, so callers need no refetch
+        return self._map_notion_response_to_page(response, page.content)
     
+    @_translate_errors(
+        PageRetrievalError,
+        "Failed to retrieve page from Notion",
+        "page retrieval",
+        not_found=_return_none
+    )
     async def get_page_by_id(self, page_id: str) -> Optional[Page]:
         """
         Retrieve a page from Notion by ID.
         
+        Recently fetched pages are served from the adapter's cache.
+        
         Args:
             page_id: Notion page ID
             
@@ -119,34 +510,33 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             PageRetrievalError: If retrieval operation fails
         """
-        try:
-            # Get page properties
-            page_response = await self._run_sync(
-                self.client.pages.retrieve,
-                page_id=page_id
-            )
-            
-            # Get page content (blocks)
-            blocks_response = await self._run_sync(
-                self.client.blocks.children.list,
-                block_id=page_id
-            )
-            
-            return self._map_notion_page_to_domain(page_response, blocks_response)
-            
-        except APIResponseError as e:
-            if e.status == 404:
-                return None
-            raise PageRetrievalError(f"Failed to retrieve page from Notion: {str(e)}")
-        except (APIConnectionError, RequestTimeoutError) as e:
-            raise PageRetrievalError(f"Failed to retrieve page from Notion: {str(e)}")
-        except Exception as e:
-            raise PageRetrievalError(f"Unexpected error during page retrieval: {str(e)}")
+        cached = self._page_cache.get(page_id)
+        if cached is not None:
+            return cached
+        
+        # Page properties and content (blocks) are independent requests
+        page_response, blocks_response = await asyncio.gather(
+            self._call(self.client.pages.retrieve, page_id=page_id),
+            self._list_blocks(page_id)
+        )
+        
+        page = self._map_notion_page_to_domain(page_response, blocks_response)
+        self._page_cache.set(page_id, page)
+        return page
     
+    @_translate_errors(
+        PageUpdateError,
+        "Failed to update page in Notion",
+        "page update",
+        not_found=_raise_page_not_found
+    )
     async def update_page(self, page: Page) -> Page:
         """
         Update an existing page in Notion.
         
+        Blank content leaves the page's blocks as they are; the returned
+        page then carries the content read back from those blocks.
+        
         Args:
             page: Page entity with updated data (must have ID)
             
@@ -158,41 +548,38 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
             PageUpdateError: If update operation fails
             ValidationError: If page data is invalid
         """
-        try:
-            if not page.has_id():
-                raise ValidationError("Page must have an ID to be updated.")
-            
+        if not page.has_id():
+            raise ValidationError("Page must have an ID to be updated.")
+        
+        # has_id() guarantees a str, which mypy cannot see through the method
+        with self._writing(cast(str, page.id)):
             # Update page properties
             properties = self._build_page_properties(page)
-            
-            response = await self._run_sync(
+        
+            response = await self._call(
                 self.client.pages.update,
                 page_id=page.id,
                 properties=properties
             )
-            
-            # Update page content if needed
-            if page.content.strip():
-                await self._update_page_content(page.id, page.content)
-            
-            # Retrieve updated page to return
-            updated_page = await self.get_page_by_id(page.id)
-            if updated_page is None:
-                raise PageNotFoundError(page.id)
-            
-            return updated_page
-            
-        except APIResponseError as e:
-            if e.status == 404:
-                raise PageNotFoundError(page.id)
-            raise PageUpdateError(f"Failed to update page in Notion: {str(e)}")
-        except (APIConnectionError, RequestTimeoutError) as e:
-            raise PageUpdateError(f"Failed to update page in Notion: {str(e)}")
-        except (PageNotFoundError, ValidationError):
-            raise
-        except Exception as e:
-            raise PageUpdateError(f"Unexpected error during page update: {str(e)}")
+        
+            # Update page content if needed. Blocks are only rewritten once the
+            # properties are saved, so a rejected update leaves the page intact.
+            if not page.content.strip():
+                # Nothing was written, so report the blocks the page still has
+                blocks_response = await self._list_blocks(page.id)
+                return self._map_notion_page_to_domain(response, blocks_response)
+        
+            await self._update_page_content(page.id, page.content)
+        
+            # The blocks now hold exactly what was written, no refetch needed
+            return self._map_notion_response_to_page(response, page.content)
     
+    @_translate_errors(
+        PageDeletionError,
+        "Failed to delete page in Notion",
+        "page deletion",
+        not_found=_return_false
+    )
     async def delete_page(self, page_id: str) -> bool:
         """
         Delete a page from Notion (archive it).
@@ -206,23 +593,15 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             PageDeletionError: If deletion operation fails
         """
-        try:
-            await self._run_sync(
+        with self._writing(page_id):
+            await self._call(
                 self.client.pages.update,
                 page_id=page_id,
                 archived=True
             )
-            return True
-            
-        except APIResponseError as e:
-            if e.status == 404:
-                return False
-            raise PageDeletionError(f"Failed to delete page in Notion: {str(e)}")
-        except (APIConnectionError, RequestTimeoutError) as e:
-            raise PageDeletionError(f"Failed to delete page in Notion: {str(e)}")
-        except Exception as e:
-            raise PageDeletionError(f"Unexpected error during page deletion: {str(e)}")
+        return True
     
+    @_translate_errors(PageRetrievalError, "Failed to list pages from Notion", "page listing")
     async def list_pages(self, limit: Optional[int] = None, offset: int = 0) -> List[Page]:
         """
         List pages from Notion workspace.
@@ -230,7 +609,9 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         This implementation searches for pages in the workspace.
         
         Args:
-            limit: Maximum number of pages to return
+            limit: Maximum number of pages to return. None or 0 returns
+                   every page in the workspace, following Notion's search
+                   cursors to the end, so pass a limit to bound the requests.
             offset: Number of pages to skip (not directly supported by Notion)
             
         Returns:
@@ -239,50 +620,68 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             PageRetrievalError: If listing operation fails
         """
-        try:
-            # Search for pages using Notion's search API
-            search_params = {
-                "filter": {
-                    "value": "page",
-                    "property": "object"
-                },
-                "sort": {
-                    "direction": "descending",
-                    "timestamp": "last_edited_time"
-                }
-            }
-            
-            if limit:
-                search_params["page_size"] = min(limit, 100)  # Notion max is 100
-            
-            response = await self._run_sync(
-                self.client.search,
-                **search_params
-            )
-            
-            pages = []
-            for page_data in response.get("results", []):
-                if page_data.get("object") == "page":
-                    # Get full page details including content
-                    full_page = await self.get_page_by_id(page_data["id"])
-                    if full_page:
-                        pages.append(full_page)
+        return [page async for page in self.iter_pages(limit, offset)]
+    
+    @_translate_errors(PageRetrievalError, "Failed to list pages from Notion", "page listing")
+    async def iter_pages(self, limit: Optional[int] = None, offset: int = 0) -> AsyncIterator[Page]:
+        """
+        Stream pages from Notion workspace, most recently edited first.
+        
+        Pages are fetched one search-result batch at a time, with the next
+        batch requested while the current one is fetched and consumed, so
+        memory stays bounded however many pages the workspace holds.
+        
+        Args:
+            limit: Maximum number of pages to yield. None or 0 yields every
+                   page in the workspace.
+            offset: Number of pages to skip; skipped pages are never fetched
             
-            # Handle offset by skipping items (simple implementation)
-            if offset > 0:
-                pages = pages[offset:]
-            return pages
-          
-        except (HTTPResponseError, APIResponseError, RequestTimeoutError) as e:
-            raise PageRetrievalError(f"Failed to list pages from Notion: {str(e)}")
+        Yields:
+            Page entities
             
-        except Exception as e:
-            raise PageRetrievalError(f"Unexpected error during page listing: {str(e)}")
+        Raises:
+            PageRetrievalError: If listing operation fails
+        """
+        # Search for pages using Notion's search API
+        search_params: Dict[str, Any] = {
+            "filter": {
+                "value": "page",
+                "property": "object"
+            },
+            "sort": {
+                "direction": "descending",
+                "timestamp": "last_edited_time"
+            }
+        }
+        
+        # Offset is applied client-side, so list enough IDs to cover it
+        if limit:
+            search_params["page_size"] = min(offset + limit, _MAX_PAGE_SIZE)
+        
+        # Get full page details including content; a limit of 0 is no limit
+        call, search = self._call, self.client.search
+        batches = self._iter_paginated_pages(
+            lambda **cursor: call(search, **search_params, **cursor),
+            offset,
+            limit or None
+        )
+        async for batch in batches:
+            for page in batch:
+                yield page
     
+    @_translate_errors(
+        PageRetrievalError,
+        "Failed to check page existence in Notion",
+        "page existence check",
+        not_found=_return_false
+    )
     async def page_exists(self, page_id: str) -> bool:
         """
         Check if a page exists in Notion.
         
+        Answered from the page cache when possible; otherwise only the
+        page itself is retrieved, not its content blocks.
+        
         Args:
             page_id: Notion page ID
             
@@ -292,29 +691,222 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             PageRetrievalError: If existence check fails
         """
-        try:
-            page = await self.get_page_by_id(page_id)
-            return page is not None
-        except PageRetrievalError:
-            raise
-        except Exception as e:
-            raise PageRetrievalError(f"Unexpected error during page existence check: {str(e)}")
+        if self._page_cache.get(page_id) is not None:
+            return True
+        
+        await self._call(self.client.pages.retrieve, page_id=page_id)
+        return True
+    
+    # Bulk Page Operations
+    
+    async def create_pages(self, pages: List[Page]) -> List[Union[Page, Exception]]:
+        """
+        Create several pages concurrently, at most max_concurrency at a time.
+        
+        Args:
+            pages: Page entities to create
+            
+        Returns:
+            One entry per input page, in order: the created page, or the
+            exception create_page raised for it
+        """
+        return await self._bounded_gather(self.create_page, pages, return_exceptions=True)
+    
+    async def update_pages(self, pages: List[Page]) -> List[Union[Page, Exception]]:
+        """
+        Update several pages concurrently, at most max_concurrency at a time.
+        
+        Args:
+            pages: Page entities with updated data (each must have an ID)
+            
+        Returns:
+            One entry per input page, in order: the updated page, or the
+            exception update_page raised for it
+        """
+        return await self._bounded_gather(self.update_page, pages, return_exceptions=True)
+    
+    async def delete_pages(self, page_ids: List[str]) -> List[Union[bool, Exception]]:
+        """
+        Delete (archive) several pages concurrently, at most max_concurrency at a time.
+        
+        Args:
+            page_ids: Notion page IDs
+            
+        Returns:
+            One entry per input ID, in order: the delete_page result, or the
+            exception delete_page raised for it
+        """
+        return await self._bounded_gather(self.delete_page, page_ids, return_exceptions=True)
     
     # Private helper methods
     
-    async def _run_sync(self, func, *args, **kwargs):
-        """Run synchronous Notion API calls in async context."""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, lambda: func(*args, **kwargs))
+    async def _call(
+        self,
+        method: Callable[..., Awaitable[Any]],
+        *,
+        idempotent: bool = True,
+        **kwargs: Any
+    ) -> Any:
+        """
+        Call a Notion client method under the rate limiter, authenticated
+        with this adapter's token.
+        
+        Rate-limited, server and gateway errors, timeouts and connection
+        failures are retried, waiting as long as Notion's Retry-After
+        header asks or else with jittered exponential backoff; anything
+        else propagates unchanged.
+        Calls that are not idempotent (creates, appends) are only retried
+        when rate limited, so a lost response cannot duplicate content.
+        """
+        last_attempt = _MAX_ATTEMPTS - 1
+        for attempt in range(_MAX_ATTEMPTS):
+            retry_after = None
+            async with self._limiter:
+                try:
+                    return await method(auth=self._token, **kwargs)
+                except HTTPResponseError as e:
+                    retryable = (
+                        e.status == _RATE_LIMITED_STATUS
+                        or (idempotent and e.status in _RETRYABLE_STATUSES)
+                    )
+                    if not retryable or attempt == last_attempt:
+                        raise
+                    headers = getattr(e, "headers", None) or {}
+                    retry_after = parse_retry_after(headers.get("Retry-After"))
+                except _TRANSIENT_ERRORS:
+                    if not idempotent or attempt == last_attempt:
+                        raise
+            if retry_after is not None:
+                # Every caller waits it out, not just this one
+                self._limiter.defer(retry_after)
+            else:
+                backoff = min(_BASE_BACKOFF * 2 ** attempt, _MAX_BACKOFF)
+                await self._sleep(backoff + random.uniform(0, _BASE_BACKOFF))
+    
+    async def _bounded_gather(
+        self,
+        func: Callable[[Any], Awaitable[Any]],
+        items: List[Any],
+        return_exceptions: bool = False
+    ) -> List[Any]:
+        """
+        Await func(item) for every item, at most max_concurrency at a time.
+
+        Results keep the order of items. With return_exceptions, failures
+        are returned in place of their result instead of being raised.
+        """
+        # Created per call: on Python 3.9 a semaphore binds to the running loop
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(item: Any) -> Any:
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(
+            *(run(item) for item in items),
+            return_exceptions=return_exceptions
+        )
+    
+    async def _get_pages_by_ids(self, page_ids: List[str]) -> List[Page]:
+        """
+        Fetch pages concurrently, dropping pages that no longer exist.
+        """
+        pages = await self._bounded_gather(self.get_page_by_id, page_ids)
+        return [page for page in pages if page]
     
-    def _get_parent_page_id(self) -> str:
+    async def _iter_paginated_pages(
+        self,
+        fetch: Callable[..., Awaitable[Dict[str, Any]]],
+        offset: int = 0,
+        limit: Optional[int] = None
+    ) -> AsyncIterator[List[Page]]:
+        """
+        Walk a cursor-paginated Notion listing, yielding its pages batch by batch.
+        
+        Offset and limit are applied to the listed IDs before any page is
+        fetched. The next cursor page is requested before the current batch
+        is hydrated, so listing and hydration overlap.
+        
+        Args:
+            fetch: Issues the listing request; called with start_cursor
+                   for every cursor page after the first
+            offset: Number of listed pages to skip
+            limit: Maximum number of pages to fetch. None walks the whole listing.
+        
+        Yields:
+            Fetched pages of one cursor page, in listing order
+        """
+        to_skip = offset
+        remaining = limit
+        next_response: Optional["asyncio.Future[Dict[str, Any]]"] = asyncio.ensure_future(fetch())
+        try:
+            while next_response is not None:
+                response = await next_response
+                next_response = None
+                
+                page_ids = [
+                    page_data["id"] for page_data in response.get("results", [])
+                    if page_data.get("object") == "page"
+                ]
+                if to_skip:
+                    skipped = min(to_skip, len(page_ids))
+                    page_ids = page_ids[skipped:]
+                    to_skip -= skipped
+                if remaining is not None:
+                    page_ids = page_ids[:remaining]
+                    remaining -= len(page_ids)
+                
+                # Prefetch the next cursor page while this batch is hydrated
+                next_cursor = response.get("next_cursor")
+                if response.get("has_more") and next_cursor and remaining != 0:
+                    next_response = asyncio.ensure_future(fetch(start_cursor=next_cursor))
+                
+                if page_ids:
+                    yield await self._get_pages_by_ids(page_ids)
+        finally:
+            if next_response is not None:
+                next_response.cancel()
+    
+    async def _get_title_property(self, database_id: str) -> str:
+        """
+        Get the name of a database's TITLE property, reused across page creations.
+        
+        Read straight from the retrieve response rather than through
+        get_database, so databases the Database model rejects (untitled,
+        select properties without options) still take pages. Falls back to
+        "Name" if the schema cannot be read or has no TITLE property.
+        """
+        title_property = self._title_property_cache.get(database_id)
+        if title_property is not None:
+            return title_property
+        
+        try:
+            response = await self._call(
+                self.client.databases.retrieve,
+                database_id=database_id
+            )
+            properties = response.get("properties") or {}
+            title_property = next(
+                (name for name, prop in properties.items() if prop.get("type") == "title"),
+                _DEFAULT_TITLE_PROPERTY
+            )
+        except Exception:
+            # The create itself reports a database that really is unusable
+            return _DEFAULT_TITLE_PROPERTY
+        
+        self._title_property_cache.set(database_id, title_property)
+        return title_property
+    
+    @cached_property
+    def parent_page_id(self) -> str:
         """
         Get the parent page ID for creating new pages.
         
         For this MVP, we'll need to configure a parent page ID.
         In a full implementation, this would be more sophisticated.
+        Resolved once per adapter; a missing ID is not cached.
         """
-        parent_id = self.auth_adapter.get_notion_database_id()
+        parent_id = self._parent_page_id or self.auth_adapter.get_notion_database_id()
         if not parent_id:
             # For MVP, we'll need to provide a default parent page
             # This should be configured via environment variables
@@ -323,23 +915,20 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
             )
         return parent_id
     
+    @cached_property
+    def _page_parent(self) -> Dict[str, str]:
+        """Notion parent payload for standalone pages, built once per adapter."""
+        return {"type": "page_id", "page_id": self.parent_page_id}
+    
     def _build_page_properties(self, page: Page) -> Dict[str, Any]:
         """Build Notion page properties from domain Page entity."""
-        properties = {}
+        return {"title": _title_prop(page.title)} if page.title else {}
 
-        if page.title:
-            properties["title"] = {
-                "title": [
-                    {
-                        "type": "text",
-                        "text": {"content": page.title}
-                    }
-                ]
-            }
-
-        return properties
-
-    def _build_database_page_properties(self, page: Page) -> Dict[str, Any]:
+    def _build_database_page_properties(
+        self,
+        page: Page,
+        title_property: str = _DEFAULT_TITLE_PROPERTY
+    ) -> Dict[str, Any]:
         """
         Build Notion page properties for a database page.
 
@@ -348,6 +937,7 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
 
         Args:
             page: Page entity with metadata['properties'] containing property values
+            title_property: Name of the database's TITLE property
 
         Returns:
             Dictionary of Notion-formatted properties
@@ -356,17 +946,7 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
 
         # Add title property (maps to database's TITLE property)
         if page.title:
-            # Find the title property name from the database
-            # For now, assume it's named "Name" or the first TITLE property
-            # In a real implementation, we'd query the database schema first
-            properties["Name"] = {  # This should match the TITLE property name in the database
-                "title": [
-                    {
-                        "type": "text",
-                        "text": {"content": page.title}
-                    }
-                ]
-            }
+            properties[title_property] = _title_prop(page.title)
 
         # Add other properties from metadata
         if page.metadata and "properties" in page.metadata:
@@ -387,61 +967,35 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
             Notion-formatted property value
         """
         # Simple implementation - infer type from value
-        if isinstance(value, bool):
-            return {"checkbox": value}
-        elif isinstance(value, (int, float)):
-            return {"number": value}
-        elif isinstance(value, str):
-            # Could be rich_text, select, url, email, etc.
-            # For MVP, treat as select if it looks like a status, otherwise rich_text
-            if prop_name in ["Status", "Priority", "Category"]:
-                return {"select": {"name": value}}
-            else:
-                return {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": value}
-                        }
-                    ]
-                }
-        elif isinstance(value, list):
-            # Multi-select
-            return {"multi_select": [{"name": v} for v in value]}
-        else:
-            # Default to rich_text
-            return {
-                "rich_text": [
-                    {
-                        "type": "text",
-                        "text": {"content": str(value)}
-                    }
-                ]
-            }
+        formatter = _PROPERTY_FORMATTERS.get(type(value))
+        if formatter is None:
+            # Subclasses (e.g. str-based enums) fall back to their base type
+            formatter = next(
+                (_PROPERTY_FORMATTERS[base] for base in type(value).__mro__
+                 if base in _PROPERTY_FORMATTERS),
+                None
+            )
+        if formatter is not None:
+            return formatter(prop_name, value)
+        # Default to rich_text
+        return _rich_text_value(str(value))
 
     def _build_page_children(self, page: Page) -> List[Dict[str, Any]]:
         """Build Notion page children blocks from domain Page entity."""
-        children = []
-        
-        if page.content:
-            # Simple paragraph block with the content
-            children.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": page.content}
-                        }
-                    ]
-                }
-            })
-        
-        return children
+        # Simple paragraph block with the content
+        return [_paragraph_block(page.content)] if page.content else []
     
-    def _map_notion_response_to_page(self, notion_response: Dict[str, Any]) -> Page:
-        """Map Notion API response to domain Page entity."""
+    def _map_notion_response_to_page(
+        self,
+        notion_response: Dict[str, Any],
+        content: str = ""
+    ) -> Page:
+        """
+        Map Notion API response to domain Page entity.
+        
+        Page responses carry no blocks, so the content is supplied by the
+        caller: what it just wrote, or what it read from the page's blocks.
+        """
         page_id = notion_response["id"]
         
         # Extract title from properties
@@ -457,13 +1011,13 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         created_time = notion_response.get("created_time")
         last_edited_time = notion_response.get("last_edited_time")
         
-        created_at = datetime.fromisoformat(created_time.replace("Z", "+00:00")) if created_time else None
-        updated_at = datetime.fromisoformat(last_edited_time.replace("Z", "+00:00")) if last_edited_time else None
+        created_at = _parse_notion_timestamp(created_time)
+        updated_at = _parse_notion_timestamp(last_edited_time)
         
         return Page(
             id=page_id,
             title=title,
-            content="",  # Content will be loaded separately
+            content=content,
             created_at=created_at,
             updated_at=updated_at,
             metadata={"notion_url": notion_response.get("url", "")}
@@ -471,69 +1025,75 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
     
     def _map_notion_page_to_domain(self, page_response: Dict[str, Any], blocks_response: Dict[str, Any]) -> Page:
         """Map Notion page and blocks to domain Page entity."""
-        # Start with basic page info
-        page = self._map_notion_response_to_page(page_response)
-        
-        # Extract content from blocks
-        content = ""
-        blocks = blocks_response.get("results", [])
-        for block in blocks:
-            if block.get("type") == "paragraph":
-                paragraph = block.get("paragraph", {})
-                rich_text = paragraph.get("rich_text", [])
-                for text_obj in rich_text:
-                    if text_obj.get("type") == "text":
-                        content += text_obj.get("text", {}).get("content", "")
-                content += "\n"  # Add newline after each paragraph
-        
-        # Create new page with content
-        return Page(
-            id=page.id,
-            title=page.title,
-            content=content.strip(),
-            created_at=page.created_at,
-            updated_at=page.updated_at,
-            metadata=page.metadata
+        # Extract content from blocks, one line per paragraph
+        paragraphs = [
+            "".join(
+                text_obj.get("text", {}).get("content", "")
+                for text_obj in block.get("paragraph", {}).get("rich_text", [])
+                if text_obj.get("type") == "text"
+            )
+            for block in blocks_response.get("results", [])
+            if block.get("type") == "paragraph"
+        ]
+        content = "\n".join(paragraphs)
+        
+        return self._map_notion_response_to_page(page_response, content.strip())
+    
+    async def _list_blocks(self, block_id: str) -> Dict[str, Any]:
+        """
+        List every child block of a page, following pagination cursors.
+        
+        Returns:
+            blocks.children.list response whose results hold all blocks
+        """
+        call, list_children = self._call, self.client.blocks.children.list
+        response = await call(
+            list_children,
+            block_id=block_id,
+            page_size=_MAX_PAGE_SIZE
         )
+        blocks = list(response.get("results", []))
+        while response.get("has_more") and response.get("next_cursor"):
+            response = await call(
+                list_children,
+                block_id=block_id,
+                page_size=_MAX_PAGE_SIZE,
+                start_cursor=response["next_cursor"]
+            )
+            blocks.extend(response.get("results", []))
+        return {"results": blocks}
     
     async def _update_page_content(self, page_id: str, content: str):
         """Update page content by replacing all blocks."""
         # Get existing blocks
-        blocks_response = await self._run_sync(
-            self.client.blocks.children.list,
-            block_id=page_id
-        )
+        blocks_response = await self._list_blocks(page_id)
         
-        # Delete existing blocks
-        for block in blocks_response.get("results", []):
-            await self._run_sync(
-                self.client.blocks.delete,
-                block_id=block["id"]
-            )
+        # Delete existing blocks concurrently
+        block_ids = [block["id"] for block in blocks_response.get("results", [])]
+        call, delete_block = self._call, self.client.blocks.delete
+        await self._bounded_gather(
+            lambda block_id: call(delete_block, block_id=block_id),
+            block_ids
+        )
         
         # Add new content
         if content.strip():
-            children = [{
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": content}
-                        }
-                    ]
-                }
-            }]
+            children = [_paragraph_block(content)]
             
-            await self._run_sync(
+            await self._call(
                 self.client.blocks.children.append,
+                idempotent=False,
                 block_id=page_id,
                 children=children
             )
 
     # Database CRUD Operations
 
+    @_translate_errors(
+        DatabaseCreationError,
+        "Failed to create database in Notion",
+        "database creation"
+    )
     async def create_database(self, database: Database) -> Database:
         """
         Create a new database in Notion.
@@ -548,56 +1108,55 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
             DatabaseCreationError: If database creation fails
             ValidationError: If database data is invalid
         """
-        from ...domain.exceptions import DatabaseCreationError
-
-        try:
-            if database.has_id():
-                raise ValidationError("Database already has an ID. Use update_database instead.")
+        if database.has_id():
+            raise ValidationError("Database already has an ID. Use update_database instead.")
 
-            if not database.is_valid():
-                raise ValidationError("Database validation failed")
+        if not database.is_valid():
+            raise ValidationError("Database validation failed")
 
-            # Build database request payload
-            payload: Dict[str, Any] = {
-                "properties": {}
-            }
-
-            # Add title
-            payload["title"] = [{"text": {"content": database.title}}]
+        # Build database request payload
+        payload: Dict[str, Any] = {
+            "properties": {}
+        }
 
-            # Add description if provided
-            if database.description:
-                payload["description"] = [{"text": {"content": database.description}}]
+        # Add title
+        payload["title"] = [{"text": {"content": database.title}}]
 
-            # Add properties schema
-            for prop_name, prop in database.properties.items():
-                payload["properties"][prop_name] = prop.to_notion_format()
+        # Add description if provided
+        if database.description:
+            payload["description"] = [{"text": {"content": database.description}}]
 
-            # Add parent
-            if database.parent_id:
-                payload["parent"] = {"type": "page_id", "page_id": database.parent_id}
-            else:
-                payload["parent"] = {"type": "workspace", "workspace": True}
+        # Add properties schema
+        for prop_name, prop in database.properties.items():
+            payload["properties"][prop_name] = prop.to_notion_format()
 
-            # Make API call
-            response = await self._run_sync(
-                self.client.databases.create,
-                **payload
-            )
+        # Add parent
+        if database.parent_id:
+            payload["parent"] = {"type": "page_id", "page_id": database.parent_id}
+        else:
+            payload["parent"] = {"type": "workspace", "workspace": True}
 
-            return self._map_notion_database_to_entity(response)
+        # Make API call
+        response = await self._call(
+            self.client.databases.create,
+            idempotent=False,
+            **payload
+        )
 
-        except (HTTPResponseError, APIResponseError, RequestTimeoutError) as e:
-            raise DatabaseCreationError(f"Failed to create database in Notion: {str(e)}")
-        except ValidationError:
-            raise
-        except Exception as e:
-            raise DatabaseCreationError(f"Unexpected error during database creation: {str(e)}")
+        return self._map_notion_database_to_entity(response)
 
+    @_translate_errors(
+        DatabaseRetrievalError,
+        "Failed to retrieve database from Notion",
+        "database retrieval",
+        not_found=_return_none
+    )
     async def get_database(self, database_id: str) -> Optional[Database]:
         """
         Retrieve a database from Notion by ID.
 
+        Recently fetched databases are served from the adapter's cache.
+
         Args:
             database_id: Notion database ID
 
@@ -607,25 +1166,25 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             DatabaseRetrievalError: If retrieval operation fails
         """
-        from ...domain.exceptions import DatabaseRetrievalError
-
-        try:
-            response = await self._run_sync(
-                self.client.databases.retrieve,
-                database_id=database_id
-            )
+        cached = self._database_cache.get(database_id)
+        if cached is not None:
+            return cached
 
-            return self._map_notion_database_to_entity(response)
+        response = await self._call(
+            self.client.databases.retrieve,
+            database_id=database_id
+        )
 
-        except APIResponseError as e:
-            if e.status == 404:
-                return None
-            raise DatabaseRetrievalError(f"Failed to retrieve database from Notion: {str(e)}")
-        except (HTTPResponseError, RequestTimeoutError) as e:
-            raise DatabaseRetrievalError(f"Failed to retrieve database from Notion: {str(e)}")
-        except Exception as e:
-            raise DatabaseRetrievalError(f"Unexpected error during database retrieval: {str(e)}")
+        database = self._map_notion_database_to_entity(response)
+        self._database_cache.set(database_id, database)
+        return database
 
+    @_translate_errors(
+        DatabaseUpdateError,
+        "Failed to update database in Notion",
+        "database update",
+        not_found=_raise_database_not_found
+    )
     async def update_database(self, database: Database) -> Database:
         """
         Update an existing database in Notion.
@@ -641,52 +1200,45 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
             DatabaseUpdateError: If update operation fails
             ValidationError: If database data is invalid
         """
-        from ...domain.exceptions import DatabaseNotFoundError, DatabaseUpdateError
+        if not database.has_id():
+            raise ValidationError("Database must have an ID to be updated.")
 
-        try:
-            if not database.has_id():
-                raise ValidationError("Database must have an ID to be updated.")
-
-            if not database.is_valid():
-                raise ValidationError("Database validation failed")
+        if not database.is_valid():
+            raise ValidationError("Database validation failed")
 
-            # Build update payload
-            payload: Dict[str, Any] = {}
+        # Build update payload
+        payload: Dict[str, Any] = {}
 
-            # Update title
-            payload["title"] = [{"text": {"content": database.title}}]
+        # Update title
+        payload["title"] = [{"text": {"content": database.title}}]
 
-            # Update description
-            if database.description:
-                payload["description"] = [{"text": {"content": database.description}}]
-            else:
-                payload["description"] = []
+        # Update description
+        if database.description:
+            payload["description"] = [{"text": {"content": database.description}}]
+        else:
+            payload["description"] = []
 
-            # Update properties schema
-            payload["properties"] = {}
-            for prop_name, prop in database.properties.items():
-                payload["properties"][prop_name] = prop.to_notion_format()
+        # Update properties schema
+        payload["properties"] = {}
+        for prop_name, prop in database.properties.items():
+            payload["properties"][prop_name] = prop.to_notion_format()
 
-            # Make API call
-            response = await self._run_sync(
+        # Make API call; has_id() above guarantees a str ID
+        with self._writing(cast(str, database.id)):
+            response = await self._call(
                 self.client.databases.update,
                 database_id=database.id,
                 **payload
             )
 
-            return self._map_notion_database_to_entity(response)
-
-        except APIResponseError as e:
-            if e.status == 404:
-                raise DatabaseNotFoundError(database.id)
-            raise DatabaseUpdateError(f"Failed to update database in Notion: {str(e)}")
-        except (HTTPResponseError, RequestTimeoutError) as e:
-            raise DatabaseUpdateError(f"Failed to update database in Notion: {str(e)}")
-        except (DatabaseNotFoundError, ValidationError):
-            raise
-        except Exception as e:
-            raise DatabaseUpdateError(f"Unexpected error during database update: {str(e)}")
+        return self._map_notion_database_to_entity(response)
 
+    @_translate_errors(
+        DatabaseDeletionError,
+        "Failed to delete database in Notion",
+        "database deletion",
+        not_found=_return_false
+    )
     async def delete_database(self, database_id: str, confirm: bool = False) -> bool:
         """
         Delete (archive) a database in Notion.
@@ -701,30 +1253,20 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             DatabaseDeletionError: If deletion operation fails
         """
-        from ...domain.exceptions import DatabaseDeletionError
-
-        try:
-            # Require explicit confirmation for safety
-            if not confirm:
-                return False
+        # Require explicit confirmation for safety
+        if not confirm:
+            return False
 
-            # Archive the database
-            await self._run_sync(
+        # Archive the database
+        with self._writing(database_id):
+            await self._call(
                 self.client.databases.update,
                 database_id=database_id,
                 archived=True
             )
-            return True
-
-        except APIResponseError as e:
-            if e.status == 404:
-                return False
-            raise DatabaseDeletionError(f"Failed to delete database in Notion: {str(e)}")
-        except (HTTPResponseError, RequestTimeoutError) as e:
-            raise DatabaseDeletionError(f"Failed to delete database in Notion: {str(e)}")
-        except Exception as e:
-            raise DatabaseDeletionError(f"Unexpected error during database deletion: {str(e)}")
+        return True
 
+    @_translate_errors(PageRetrievalError, "Failed to query database pages", "database query")
     async def query_database_pages(self, database_id: str) -> List[Page]:
         """
         Query pages in a database.
@@ -738,25 +1280,16 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Raises:
             PageRetrievalError: If query operation fails
         """
-        try:
-            response = await self._run_sync(
-                self.client.databases.query,
-                database_id=database_id
+        # Get full page details
+        call, query = self._call, self.client.databases.query
+        batches = self._iter_paginated_pages(
+            lambda **cursor: call(
+                query,
+                database_id=database_id,
+                **cursor
             )
-
-            pages = []
-            for page_data in response.get("results", []):
-                # Get full page details
-                full_page = await self.get_page_by_id(page_data["id"])
-                if full_page:
-                    pages.append(full_page)
-
-            return pages
-
-        except (HTTPResponseError, APIResponseError, RequestTimeoutError) as e:
-            raise PageRetrievalError(f"Failed to query database pages: {str(e)}")
-        except Exception as e:
-            raise PageRetrievalError(f"Unexpected error during database query: {str(e)}")
+        )
+        return [page async for batch in batches for page in batch]
 
     def _map_notion_database_to_entity(self, notion_response: Dict[str, Any]) -> Database:
         """
@@ -785,36 +1318,21 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
 
         # Extract properties
         properties: Dict[str, DatabaseProperty] = {}
-        props_data = notion_response.get("properties", {})
-
-        for prop_name, prop_data in props_data.items():
-            prop_type_str = prop_data.get("type", "")
-
+        for prop_name, prop_data in notion_response.get("properties", {}).items():
             # Map Notion type to PropertyType enum
-            prop_type = self._map_notion_type_to_enum(prop_type_str)
-
-            # Extract configuration
-            config: Dict[str, Any] = {}
-            if prop_type == PropertyType.SELECT and "select" in prop_data:
-                config["options"] = prop_data["select"].get("options", [])
-            elif prop_type == PropertyType.MULTI_SELECT and "multi_select" in prop_data:
-                config["options"] = prop_data["multi_select"].get("options", [])
-            elif prop_type == PropertyType.NUMBER and "number" in prop_data:
-                if "format" in prop_data["number"]:
-                    config["format"] = prop_data["number"]["format"]
-
+            prop_type = _NOTION_TYPE_TO_ENUM.get(prop_data.get("type", ""), PropertyType.RICH_TEXT)
             properties[prop_name] = DatabaseProperty(
                 name=prop_name,
                 property_type=prop_type,
-                config=config
+                config=_extract_property_config(prop_type, prop_data)
             )
 
         # Extract timestamps
         created_time = notion_response.get("created_time")
         last_edited_time = notion_response.get("last_edited_time")
 
-        created_at = datetime.fromisoformat(created_time.replace("Z", "+00:00")) if created_time else None
-        updated_at = datetime.fromisoformat(last_edited_time.replace("Z", "+00:00")) if last_edited_time else None
+        created_at = _parse_notion_timestamp(created_time)
+        updated_at = _parse_notion_timestamp(last_edited_time)
 
         # Extract metadata
         metadata = {
@@ -843,16 +1361,4 @@ class NotionPageRepositoryAdapter(PageRepositoryPort):
         Returns:
             PropertyType enum value
         """
-        type_mapping = {
-            "title": PropertyType.TITLE,
-            "rich_text": PropertyType.RICH_TEXT,
-            "number": PropertyType.NUMBER,
-            "select": PropertyType.SELECT,
-            "multi_select": PropertyType.MULTI_SELECT,
-            "date": PropertyType.DATE,
-            "checkbox": PropertyType.CHECKBOX,
-            "url": PropertyType.URL,
-            "email": PropertyType.EMAIL
-        }
-
-        return type_mapping.get(notion_type, PropertyType.RICH_TEXT)
\ No newline at end of file
+        return _NOTION_TYPE_TO_ENUM.get(notion_type, PropertyType.RICH_TEXT)
\ No newline at end of file
@@ -0,0 +1,111 @@
+"""
+Client-side rate limiting for outbound Notion API requests.
+
+Notion allows an average of about three requests per second per
+integration. NotionRateLimiter is a token bucket that spaces requests out
+so concurrent callers stay under that budget instead of tripping 429s,
+and holds every caller back when Notion answers with ``Retry-After``.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a ``Retry-After`` header given in seconds.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or not a number
+    """
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return max(seconds, 0.0)
+
+
+class NotionRateLimiter:
+    """
+    Token bucket limiting how many requests may start per second.
+
+    Use as an async context manager around each request::
+
+        async with limiter:
+            await client.pages.retrieve(page_id=page_id)
+    """
+
+    def __init__(
+        self,
+        rate: float = 3.0,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            rate: Sustained requests allowed per second
+            burst: Requests allowed back to back; defaults to the rate
+            clock: Monotonic time source, overridable for tests
+            sleep: Coroutine waiting the given seconds, overridable for tests
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(1, int(rate))
+        if self.capacity < 1:
+            raise ValueError("burst must be at least 1")
+
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated_at = clock()
+        self._blocked_until = 0.0
+        # Created lazily: on Python 3.9 a lock binds to the loop it was made in
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        """Wait until a request may start, then consume one token."""
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            while True:
+                now = self._clock()
+                if now < self._blocked_until:
+                    await self._sleep(self._blocked_until - now)
+                    continue
+
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate
+                )
+                self._updated_at = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await self._sleep((1 - self._tokens) / self.rate)
+
+    def defer(self, delay: float) -> None:
+        """
+        Hold back every request for at least delay seconds from now.
+
+        Used when Notion answers 429 with a Retry-After header, so all
+        concurrent callers back off together instead of each retrying.
+        """
+        self._blocked_until = max(self._blocked_until, self._clock() + delay)
+
+    async def __aenter__(self) -> "NotionRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        return None
@@ -0,0 +1,68 @@
+"""
+In-memory implementation of PageRepositoryPort.
+
+Lets tests written against the real Notion adapter also run without
+network access or credentials, exercising the application layer against
+a repository that behaves like the adapter: IDs and timestamps are
+assigned on create, missing pages read as None, and listings are
+ordered by last edit, newest first.
+"""
+
+import uuid
+from dataclasses import replace
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from packages.domain.models.page import Page
+from packages.domain.ports.page_repository import PageRepositoryPort
+from packages.domain.exceptions import PageNotFoundError, ValidationError
+
+
+class InMemoryPageRepository(PageRepositoryPort):
+    """PageRepositoryPort backed by a dict of pages keyed by ID."""
+
+    def __init__(self):
+        self.pages: Dict[str, Page] = {}
+
+    async def create_page(self, page: Page) -> Page:
+        if page.has_id():
+            raise ValidationError("Page already has an ID. Use update_page instead.")
+        if page.is_empty():
+            raise ValidationError("Page must have either title or content.")
+
+        now = datetime.now(timezone.utc)
+        created = replace(page, id=str(uuid.uuid4()), created_at=now, updated_at=now)
+        self.pages[created.id] = created
+        return created
+
+    async def get_page_by_id(self, page_id: str) -> Optional[Page]:
+        return self.pages.get(page_id)
+
+    async def update_page(self, page: Page) -> Page:
+        if not page.has_id():
+            raise ValidationError("Page must have an ID to be updated.")
+        existing = self.pages.get(page.id)
+        if existing is None:
+            raise PageNotFoundError(page.id)
+
+        # Like the Notion adapter, blank content leaves the stored content alone
+        updated = replace(
+            page,
+            content=page.content if page.content.strip() else existing.content,
+            created_at=existing.created_at,
+            updated_at=datetime.now(timezone.utc)
+        )
+        self.pages[page.id] = updated
+        return updated
+
+    async def delete_page(self, page_id: str) -> bool:
+        return self.pages.pop(page_id, None) is not None
+
+    async def list_pages(self, limit: Optional[int] = None, offset: int = 0) -> List[Page]:
+        pages = sorted(self.pages.values(), key=lambda page: page.updated_at, reverse=True)
+        # Like the Notion adapter, a limit of 0 means no limit
+        end = offset + limit if limit else None
+        return pages[offset:end]
+
+    async def page_exists(self, page_id: str) -> bool:
+        return page_id in self.pages
@@ -0,0 +1,169 @@
+"""
+Integration test configuration.
+
+Notion traffic is recorded to cassettes under ``cassettes/`` by
+pytest-recording (vcrpy) on the first run and replayed from disk after
+that. Set ``NOTION_RECORD=1`` to re-record every cassette against the
+live API.
+
+The suite can be sharded across pytest-xdist workers with
+``pytest -n auto --dist=loadgroup tests/integration``. While recording,
+each worker creates its pages under its own parent page, so concurrent
+workers never see each other's pages.
+
+Tests using ``app_service`` run twice: against an in-memory repository,
+always, and against Notion, only when NOTION_TOKEN and
+NOTION_DATABASE_ID are set.
+"""
+
+import asyncio
+import os
+
+import httpx
+import pytest
+
+from packages.domain.models.page import Page
+from packages.infrastructure.adapters.auth import AuthenticationAdapter
+from packages.infrastructure.adapters.notion_adapter import NotionPageRepositoryAdapter
+from packages.application.use_cases.page_operations import PageApplicationService
+from tests.fixtures.in_memory_page_repository import InMemoryPageRepository
+
+
+_RECORDING = os.getenv("NOTION_RECORD") == "1"
+
+# Re-record everything when asked to, otherwise record only missing cassettes
+_RECORD_MODE = "all" if _RECORDING else "once"
+
+# The live variant of app_service needs real credentials
+_REQUIRES_NOTION = pytest.mark.skipif(
+    not (os.getenv("NOTION_TOKEN") and os.getenv("NOTION_DATABASE_ID")),
+    reason="Live integration tests require NOTION_TOKEN and NOTION_DATABASE_ID environment variables"
+)
+
+# xdist worker name; "gw0" when running without xdist
+_WORKER = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+
+
+@pytest.fixture(scope="module")
+def vcr_config():
+    """
+    vcrpy settings shared by every integration cassette.
+
+    Request bodies are not matched: they embed the parent page, which
+    differs between a recording run and a replay. Matching requests are
+    replayed in the order they were recorded.
+    """
+    return {
+        "record_mode": _RECORD_MODE,
+        "filter_headers": ["authorization"],
+        "match_on": ["method", "scheme", "host", "path", "query"],
+    }
+
+
+@pytest.fixture(scope="session")
+def auth_adapter():
+    """Authentication adapter for integration tests."""
+    return AuthenticationAdapter()
+
+
+@pytest.fixture(scope="session")
+async def http_client():
+    """
+    One keep-alive connection pool shared by every adapter in the session.
+
+    Only its limits are set here: notion-client replaces the timeout,
+    base URL and headers of any client it is given.
+    """
+    client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    )
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture(scope="session")
+async def worker_parent_page_id(auth_adapter, http_client):
+    """
+    Parent page for everything this worker creates, or None when replaying.
+
+    Created under NOTION_DATABASE_ID at the start of a recording session
+    and archived, together with its children, at the end.
+    """
+    if not _RECORDING:
+        yield None
+        return
+
+    adapter = NotionPageRepositoryAdapter(auth_adapter, http_client=http_client)
+    parent = await adapter.create_page(Page(title=f"Integration tests {_WORKER}"))
+    yield parent.id
+    await adapter.delete_page(parent.id)
+
+
+@pytest.fixture(scope="session")
+def notion_adapter(auth_adapter, worker_parent_page_id, http_client):
+    """Notion adapter for integration tests."""
+    return NotionPageRepositoryAdapter(
+        auth_adapter,
+        parent_page_id=worker_parent_page_id,
+        http_client=http_client
+    )
+
+
+@pytest.fixture(
+    scope="session",
+    params=["fake", pytest.param("live", marks=_REQUIRES_NOTION)]
+)
+def app_service(request):
+    """Application service over an in-memory repository or the Notion adapter."""
+    if request.param == "live":
+        return PageApplicationService(request.getfixturevalue("notion_adapter"))
+    return PageApplicationService(InMemoryPageRepository())
+
+
+class PageTracker:
+    """Remembers pages a test created so they can be deleted afterwards."""
+
+    def __init__(self):
+        self.pages = {}
+
+    def __call__(self, page):
+        """Track page for cleanup and return it unchanged."""
+        if page is not None and page.has_id():
+            self.pages[page.id] = page
+        return page
+
+    def forget(self, page_id):
+        """Stop tracking a page the test has already deleted itself."""
+        self.pages.pop(page_id, None)
+
+
+@pytest.fixture
+async def page_tracker(app_service):
+    """
+    Track pages created by a test and delete them concurrently on teardown.
+
+    Cleanup errors are ignored: the test's own outcome is what matters.
+    """
+    tracker = PageTracker()
+    yield tracker
+    await asyncio.gather(
+        *(app_service.delete_page(page_id) for page_id in tracker.pages),
+        return_exceptions=True
+    )
+
+
+@pytest.fixture
+def test_page_data(request):
+    """
+    Test data for creating pages.
+
+    Keyed on the test's name: unique within a run, so concurrent workers
+    never collide, and identical between runs, so replayed responses
+    carry the titles the test expects.
+    """
+    uid = request.node.name
+    return {
+        "title": f"Test Page {uid}",
+        "content": f"This is test content created by {uid} for integration testing.",
+        "metadata": {"test": True, "created_by": "integration_test"}
+    }
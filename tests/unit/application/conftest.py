@@ -0,0 +1,30 @@
+"""
+Shared fixtures for application-layer unit tests.
+"""
+
+import pytest
+from unittest.mock import AsyncMock
+
+
+class FakePageRepository:
+    """
+    Stand-in for PageRepositoryPort with one AsyncMock per port method.
+
+    Cheaper to build than AsyncMock(spec=PageRepositoryPort), which
+    introspects the port on every construction, while keeping the same
+    return_value and assert_called_* API the tests rely on.
+    """
+
+    def __init__(self):
+        self.create_page = AsyncMock()
+        self.get_page_by_id = AsyncMock()
+        self.update_page = AsyncMock()
+        self.delete_page = AsyncMock()
+        self.list_pages = AsyncMock()
+        self.page_exists = AsyncMock()
+
+
+@pytest.fixture
+def mock_repository():
+    """Fake page repository for testing."""
+    return FakePageRepository()
@@ -6,118 +6,113 @@ according to business rules and maintains data integrity.
 """
 
 import pytest
+from dataclasses import FrozenInstanceError, asdict, replace
 from datetime import datetime
 from packages.domain.models.page import Page
 
 
+# Keep this module on one xdist worker under --dist=loadgroup too, as
+# --dist=loadfile (the default in pyproject.toml) already does
+pytestmark = pytest.mark.xdist_group("domain_page")
+
+_CREATED_AT = datetime(2023, 1, 1, 12, 0, 0)
+_UPDATED_AT = datetime(2023, 1, 1, 12, 0, 1)
+
+_LONG_CONTENT = "x" * 10_000
+
+_SPECIAL_TITLE = "Special chars: àáâãäåæçèéêë"
+_SPECIAL_CONTENT = "Content with émojis: 🚀 💻 ✨"
+
+
+@pytest.fixture(
+    scope="module",
+    params=[{}, {"title": "", "content": ""}, {"title": "   ", "content": "   "}],
+    ids=["default", "empty", "whitespace"]
+)
+def blank_page(request):
+    """Page with no title or content, built once per module for each variant."""
+    return Page(**request.param)
+
+
 class TestPage:
     """Test cases for the Page domain model."""
     
-    def test_page_creation_with_minimal_data(self):
-        """Test creating a page with minimal required data."""
-        page = Page(title="Test Page")
-        
-        assert page.title == "Test Page"
-        assert page.content == ""
-        assert page.id is None
-        assert page.created_at is None
-        assert page.updated_at is None
-        assert page.metadata == {}
-    
-    def test_page_creation_with_full_data(self):
-        """Test creating a page with all fields populated."""
-        created_at = datetime.now()
-        updated_at = datetime.now()
-        metadata = {"source": "test", "category": "demo"}
-        
-        page = Page(
-            id="test-id",
-            title="Full Test Page",
-            content="This is test content",
-            created_at=created_at,
-            updated_at=updated_at,
-            metadata=metadata
-        )
-        
-        assert page.id == "test-id"
-        assert page.title == "Full Test Page"
-        assert page.content == "This is test content"
-        assert page.created_at == created_at
-        assert page.updated_at == updated_at
-        assert page.metadata == metadata
-    
-    def test_page_creation_with_none_metadata(self):
-        """Test that None metadata is converted to empty dict."""
-        page = Page(title="Test", metadata=None)
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            (
+                {"title": "Test Page"},
+                {"id": None, "title": "Test Page", "content": "", "created_at": None,
+                 "updated_at": None, "metadata": {}}
+            ),
+            (
+                {"id": "test-id", "title": "Full Test Page", "content": "This is test content",
+                 "created_at": _CREATED_AT, "updated_at": _UPDATED_AT,
+                 "metadata": {"source": "test", "category": "demo"}},
+                {"id": "test-id", "title": "Full Test Page", "content": "This is test content",
+                 "created_at": _CREATED_AT, "updated_at": _UPDATED_AT,
+                 "metadata": {"source": "test", "category": "demo"}}
+            ),
+            (
+                {"title": "Test", "metadata": None},
+                {"id": None, "title": "Test", "content": "", "created_at": None,
+                 "updated_at": None, "metadata": {}}
+            )
+        ],
+        ids=["minimal", "full", "none_metadata"]
+    )
+    def test_page_creation(self, kwargs, expected):
+        """Test that construction stores every field and defaults metadata to {}."""
+        page = Page(**kwargs)
         
-        assert page.metadata == {}
+        assert asdict(page) == expected
     
-    def test_page_is_empty_with_no_content(self):
+    def test_blank_page_is_empty(self, blank_page):
         """Test is_empty returns True when page has no title or content."""
-        page = Page()
-        assert page.is_empty() is True
-        
-        page = Page(title="", content="")
-        assert page.is_empty() is True
-        
-        page = Page(title="   ", content="   ")
-        assert page.is_empty() is True
-    
-    def test_page_is_empty_with_title_only(self):
-        """Test is_empty returns False when page has title."""
-        page = Page(title="Test Title")
-        assert page.is_empty() is False
+        assert blank_page.is_empty() is True
     
-    def test_page_is_empty_with_content_only(self):
-        """Test is_empty returns False when page has content."""
-        page = Page(content="Test content")
-        assert page.is_empty() is False
-    
-    def test_page_is_empty_with_both_title_and_content(self):
-        """Test is_empty returns False when page has both title and content."""
-        page = Page(title="Test Title", content="Test content")
+    @pytest.mark.parametrize(
+        "title, content",
+        [("Test Title", ""), ("", "Test content"), ("Test Title", "Test content")],
+        ids=["title_only", "content_only", "title_and_content"]
+    )
+    def test_page_with_text_is_not_empty(self, title, content):
+        """Test is_empty returns False when page has a title or content."""
+        page = Page(title=title, content=content)
         assert page.is_empty() is False
     
-    def test_page_has_id_with_no_id(self):
-        """Test has_id returns False when page has no ID."""
-        page = Page(title="Test")
-        assert page.has_id() is False
-        
-        page = Page(title="Test", id="")
-        assert page.has_id() is False
-        
-        page = Page(title="Test", id="   ")
-        assert page.has_id() is False
-    
-    def test_page_has_id_with_valid_id(self):
-        """Test has_id returns True when page has valid ID."""
-        page = Page(title="Test", id="valid-id")
-        assert page.has_id() is True
-    
-    def test_page_string_representation(self):
-        """Test page string representation."""
-        page = Page(id="test-id", title="Test Title", content="Some content")
-        str_repr = str(page)
-        
-        assert "test-id" in str_repr
-        assert "Test Title" in str_repr
-        assert "content_length=" in str_repr
+    @pytest.mark.parametrize(
+        "page_id, expected",
+        [(None, False), ("", False), ("   ", False), ("valid-id", True)],
+        ids=["no_id", "empty_id", "whitespace_id", "valid_id"]
+    )
+    def test_page_has_id(self, page_id, expected):
+        """Test has_id is True only for a non-blank ID."""
+        page = Page(title="Test", id=page_id)
+        assert page.has_id() is expected
     
-    def test_page_string_representation_long_title(self):
-        """Test page string representation with long title."""
-        long_title = "This is a very long title that should be truncated in the string representation"
-        page = Page(id="test-id", title=long_title, content="Some content")
-        str_repr = str(page)
+    @pytest.mark.parametrize(
+        "title, shown_title",
+        [
+            ("Test Title", "Test Title"),
+            (
+                "This is a very long title that should be truncated in the string representation",
+                "This is a very long title that should be truncated"
+            )
+        ],
+        ids=["short", "long"]
+    )
+    def test_page_string_representation(self, title, shown_title):
+        """Test string representation shows the ID, at most 50 title characters and content length."""
+        page = Page(id="test-id", title=title, content="Some content")
         
-        assert "test-id" in str_repr
-        assert len(str_repr) < len(long_title) + 100  # Should be truncated
-        assert "..." in str_repr
+        assert str(page) == f"Page(id=test-id, title='{shown_title}...', content_length=12)"
     
     def test_page_immutability(self):
         """Test that Page is immutable (frozen dataclass)."""
         page = Page(title="Test")
         
-        with pytest.raises(AttributeError):
+        with pytest.raises(FrozenInstanceError):
             page.title = "New Title"
     
     def test_page_equality(self):
@@ -128,51 +123,21 @@ class TestPage:
         
         assert page1 == page2
         assert page1 != page3
+        # Changing the id alone is enough to make page1 unequal to page3
+        assert replace(page1, id="2") == page3
     
     def test_page_with_special_characters(self):
         """Test page with special characters in title and content."""
-        page = Page(
-            title="Special chars: àáâãäåæçèéêë",
-            content="Content with émojis: 🚀 💻 ✨"
-        )
+        page = Page(title=_SPECIAL_TITLE, content=_SPECIAL_CONTENT)
         
-        assert "àáâãäåæçèéêë" in page.title
-        assert "🚀 💻 ✨" in page.content
+        assert page.title == _SPECIAL_TITLE
+        assert page.content == _SPECIAL_CONTENT
         assert not page.is_empty()
     
     def test_page_with_very_long_content(self):
         """Test page with very long content."""
-        long_content = "x" * 10000
-        page = Page(title="Test", content=long_content)
+        page = Page(title="Test", content=_LONG_CONTENT)
         
-        assert len(page.content) == 10000
+        assert page.content is _LONG_CONTENT
         assert not page.is_empty()
 
-
-@pytest.fixture
-def sample_page():
-    """Fixture providing a sample page for testing."""
-    return Page(
-        id="sample-id",
-        title="Sample Page",
-        content="This is sample content for testing",
-        created_at=datetime(2023, 1, 1),
-        updated_at=datetime(2023, 1, 2),
-        metadata={"category": "test", "priority": "high"}
-    )
-
-
-@pytest.fixture
-def empty_page():
-    """Fixture providing an empty page for testing."""
-    return Page()
-
-
-@pytest.fixture
-def page_without_id():
-    """Fixture providing a page without ID for testing creation scenarios."""
-    return Page(
-        title="New Page",
-        content="Content for new page",
-        metadata={"status": "draft"}
-    )
\ No newline at end of file
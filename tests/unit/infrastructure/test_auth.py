@@ -0,0 +1,187 @@
+"""
+Unit tests for the authentication adapter.
+
+This module tests how AuthenticationAdapter loads .env files and
+memoizes credentials, using temporary files and a scrubbed environment
+so no real credentials are read.
+"""
+
+import os
+import sys
+
+import pytest
+from packages.infrastructure.adapters.auth import AuthenticationAdapter, _NOTION_ENV_KEYS
+
+
+@pytest.fixture(autouse=True)
+def clean_env(monkeypatch):
+    """Environment without Notion settings and an empty .env memo."""
+    for key in _NOTION_ENV_KEYS:
+        # setenv first so teardown also removes values load_dotenv sets
+        monkeypatch.setenv(key, "")
+        monkeypatch.delenv(key)
+    AuthenticationAdapter.clear_dotenv_cache()
+    yield
+    AuthenticationAdapter.clear_dotenv_cache()
+
+
+@pytest.fixture
+def env_file(tmp_path):
+    """.env file providing a Notion token."""
+    path = tmp_path / ".env"
+    path.write_text("NOTION_TOKEN=token-from-file\n")
+    return path
+
+
+def _touch_later(path):
+    """Move a file's mtime forward, as an edit would."""
+    mtime = os.stat(path).st_mtime + 10
+    os.utime(path, (mtime, mtime))
+
+
+class TestLoadEnvFile:
+    """Test cases for .env loading."""
+
+    def test_loads_env_file(self, env_file):
+        """Test that the first adapter loads the .env file."""
+        # Act
+        AuthenticationAdapter(env_file=str(env_file))
+
+        # Assert
+        assert os.environ["NOTION_TOKEN"] == "token-from-file"
+
+    def test_loads_each_file_once_per_process(self, env_file, monkeypatch):
+        """Test that an unchanged .env file is not parsed again."""
+        # Arrange
+        AuthenticationAdapter(env_file=str(env_file))
+        monkeypatch.delenv("NOTION_TOKEN")
+
+        # Act
+        AuthenticationAdapter(env_file=str(env_file))
+
+        # Assert
+        assert "NOTION_TOKEN" not in os.environ
+
+    def test_reloads_after_file_changes(self, env_file, monkeypatch):
+        """Test that a modified .env file is loaded again."""
+        # Arrange
+        AuthenticationAdapter(env_file=str(env_file))
+        monkeypatch.delenv("NOTION_TOKEN")
+        env_file.write_text("NOTION_TOKEN=edited-token\n")
+        _touch_later(env_file)
+
+        # Act
+        AuthenticationAdapter(env_file=str(env_file))
+
+        # Assert
+        assert os.environ["NOTION_TOKEN"] == "edited-token"
+
+    def test_clear_dotenv_cache_forces_reload(self, env_file, monkeypatch):
+        """Test that clearing the memo reloads an unchanged .env file."""
+        # Arrange
+        AuthenticationAdapter(env_file=str(env_file))
+        monkeypatch.delenv("NOTION_TOKEN")
+
+        # Act
+        AuthenticationAdapter.clear_dotenv_cache()
+        AuthenticationAdapter(env_file=str(env_file))
+
+        # Assert
+        assert os.environ["NOTION_TOKEN"] == "token-from-file"
+
+    def test_missing_env_file_is_ignored(self, tmp_path):
+        """Test that a nonexistent .env path loads nothing and does not raise."""
+        # Act
+        AuthenticationAdapter(env_file=str(tmp_path / "missing.env"))
+
+        # Assert
+        assert "NOTION_TOKEN" not in os.environ
+
+    def test_skips_dotenv_when_environment_is_configured(self, monkeypatch):
+        """Test that dotenv is never imported when every setting is already set."""
+        # Arrange
+        monkeypatch.setenv("NOTION_TOKEN", "env-token")
+        monkeypatch.setenv("NOTION_DATABASE_ID", "env-database")
+        # A None entry makes any "from dotenv import ..." raise ImportError
+        monkeypatch.setitem(sys.modules, "dotenv", None)
+
+        # Act
+        adapter = AuthenticationAdapter()
+
+        # Assert
+        assert adapter.get_notion_token() == "env-token"
+
+
+@pytest.fixture
+def configured_env(monkeypatch):
+    """Environment providing every Notion setting, so no .env is read."""
+    monkeypatch.setenv("NOTION_TOKEN", "old-token")
+    monkeypatch.setenv("NOTION_DATABASE_ID", "old-database")
+
+
+class TestCredentialMemoization:
+    """Test cases for memoized credential lookups."""
+
+    def test_token_is_served_stale_until_invalidated(self, configured_env, monkeypatch):
+        """Test that a changed token is only seen after invalidate()."""
+        # Arrange
+        adapter = AuthenticationAdapter()
+        assert adapter.get_notion_token() == "old-token"
+        monkeypatch.setenv("NOTION_TOKEN", "new-token")
+
+        # Act
+        stale = adapter.get_notion_token()
+        adapter.invalidate()
+        fresh = adapter.get_notion_token()
+
+        # Assert
+        assert stale == "old-token"
+        assert fresh == "new-token"
+
+    def test_missing_token_is_not_memoized(self, configured_env, monkeypatch):
+        """Test that a ValueError for a blank token is not cached."""
+        # Arrange
+        adapter = AuthenticationAdapter()
+        monkeypatch.setenv("NOTION_TOKEN", "   ")
+        with pytest.raises(ValueError, match="NOTION_TOKEN"):
+            adapter.get_notion_token()
+        monkeypatch.setenv("NOTION_TOKEN", "late-token")
+
+        # Act
+        token = adapter.get_notion_token()
+
+        # Assert
+        assert token == "late-token"
+
+    def test_database_id_is_served_stale_until_invalidated(self, configured_env, monkeypatch):
+        """Test that a changed database ID is only seen after invalidate()."""
+        # Arrange
+        adapter = AuthenticationAdapter()
+        assert adapter.get_notion_database_id() == "old-database"
+        monkeypatch.setenv("NOTION_DATABASE_ID", "new-database")
+
+        # Act
+        stale = adapter.get_notion_database_id()
+        adapter.invalidate()
+        fresh = adapter.get_notion_database_id()
+
+        # Assert
+        assert stale == "old-database"
+        assert fresh == "new-database"
+
+    def test_absent_database_id_is_memoized(self, configured_env, monkeypatch):
+        """Test that an unset database ID is remembered as None until invalidate()."""
+        # Arrange
+        adapter = AuthenticationAdapter()
+        monkeypatch.delenv("NOTION_DATABASE_ID")
+        assert adapter.get_notion_database_id() is None
+        monkeypatch.setenv("NOTION_DATABASE_ID", "late-database")
+
+        # Act
+        stale = adapter.get_notion_database_id()
+        adapter.invalidate()
+        fresh = adapter.get_notion_database_id()
+
+        # Assert
+        assert stale is None
+        assert fresh == "late-database"
@@ -0,0 +1,90 @@
+"""
+Unit tests for the infrastructure TTL cache.
+
+This module tests expiry, LRU eviction and invalidation of TTLCache
+using a controllable clock.
+"""
+
+import pytest
+from packages.infrastructure.adapters.cache import TTLCache
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    """Clock starting at zero."""
+    return FakeClock()
+
+
+class TestTTLCache:
+    """Test cases for TTLCache."""
+    
+    def test_returns_value_while_fresh(self, clock):
+        """Test that a stored value is returned before it expires."""
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("page-1", "value")
+        
+        clock.now = 9.9
+        
+        assert cache.get("page-1") == "value"
+    
+    def test_expires_after_ttl(self, clock):
+        """Test that a value is dropped once its TTL has elapsed."""
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("page-1", "value")
+        
+        clock.now = 10.0
+        
+        assert cache.get("page-1") is None
+        assert len(cache) == 0
+    
+    def test_evicts_least_recently_used(self, clock):
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(ttl=10, maxsize=2, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        
+        cache.set("c", 3)
+        
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+    
+    def test_invalidate_and_clear(self, clock):
+        """Test that invalidate drops one entry and clear drops all."""
+        cache = TTLCache(ttl=10, clock=clock)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        
+        cache.invalidate("a")
+        cache.invalidate("missing")
+        
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        
+        cache.clear()
+        
+        assert len(cache) == 0
+    
+    def test_zero_ttl_disables_caching(self, clock):
+        """Test that a TTL of 0 never stores anything."""
+        cache = TTLCache(ttl=0, clock=clock)
+        cache.set("a", 1)
+        
+        assert cache.get("a") is None
+    
+    @pytest.mark.parametrize("kwargs", [{"ttl": -1}, {"ttl": 1, "maxsize": 0}])
+    def test_rejects_invalid_arguments(self, kwargs):
+        """Test that negative TTLs and empty caches are rejected."""
+        with pytest.raises(ValueError):
+            TTLCache(**kwargs)
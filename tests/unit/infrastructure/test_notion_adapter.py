@@ -0,0 +1,743 @@
+"""
+Unit tests for the Notion page repository adapter.
+
+This module tests NotionPageRepositoryAdapter without network access:
+the connection pool is inspected directly, and Notion responses come
+from fakes standing in for notion-client endpoints.
+"""
+
+import asyncio
+from datetime import datetime
+
+import httpx
+import pytest
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+from packages.domain.exceptions import (
+    DatabaseRetrievalError,
+    PageCreationError,
+    PageNotFoundError,
+    PageRetrievalError,
+    PageUpdateError,
+)
+from packages.domain.models.page import Page
+from packages.infrastructure.adapters.auth import AuthenticationAdapter
+from packages.infrastructure.adapters.cache import TTLCache
+from packages.infrastructure.adapters.notion_adapter import (
+    NotionPageRepositoryAdapter,
+    _BASE_BACKOFF,
+    _MAX_ATTEMPTS,
+    _parse_notion_timestamp,
+)
+from packages.infrastructure.adapters.rate_limit import NotionRateLimiter
+
+
+# Notion error code sent with each HTTP status the tests use
+_ERROR_CODES = {
+    400: "validation_error",
+    404: "object_not_found",
+    429: "rate_limited",
+    500: "internal_server_error",
+    503: "service_unavailable",
+}
+
+
+# pages.update response for a page titled "New title"
+_PAGE_RESPONSE = {
+    "object": "page",
+    "id": "page-1",
+    "properties": {"title": {"title": [{"text": {"content": "New title"}}]}},
+    "created_time": "2025-10-01T09:00:00.000Z",
+    "last_edited_time": "2025-10-02T10:00:00.000Z",
+    "url": "https://www.notion.so/page-1",
+}
+
+# blocks.children.list response for a page holding one paragraph
+_BLOCKS_RESPONSE = {
+    "results": [{
+        "id": "block-1",
+        "type": "paragraph",
+        "paragraph": {"rich_text": [{"type": "text", "text": {"content": "Old content"}}]},
+    }],
+    "has_more": False,
+}
+
+
+class FakeTime:
+    """Clock that only moves when something sleeps on it."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class FakeEndpoint:
+    """Notion client method that raises scripted errors, then answers."""
+
+    def __init__(self, *errors, result=None):
+        self.errors = list(errors)
+        self.result = result if result is not None else {"object": "page", "id": "page-1"}
+        self.calls = []
+
+    async def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.result
+
+
+class FakeListing:
+    """
+    Cursor-paginated Notion listing served from fixed batches of page IDs.
+
+    With a gate, requests for later cursors wait on it, so a test can
+    observe a prefetch that is still in flight.
+    """
+
+    def __init__(self, *batches, gate=None):
+        self.batches = batches
+        self.gate = gate
+        self.cursors = []
+        self.cancelled = []
+
+    async def __call__(self, start_cursor=None, **kwargs):
+        self.cursors.append(start_cursor)
+        if start_cursor is not None and self.gate is not None:
+            try:
+                await self.gate.wait()
+            except asyncio.CancelledError:
+                self.cancelled.append(start_cursor)
+                raise
+        index = int(start_cursor or 0)
+        has_more = index + 1 < len(self.batches)
+        return {
+            "results": [{"object": "page", "id": page_id} for page_id in self.batches[index]],
+            "has_more": has_more,
+            "next_cursor": str(index + 1) if has_more else None,
+        }
+
+
+class FakeOperation:
+    """
+    Per-item adapter method that records how many calls overlap.
+
+    Later items finish first, so results that come back in input order
+    were put there by the caller rather than by completion order.
+    """
+
+    def __init__(self, items, failing=None):
+        self.items = list(items)
+        self.failing = failing
+        self.active = 0
+        self.peak = 0
+
+    async def __call__(self, item):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            position = next(i for i, candidate in enumerate(self.items) if candidate is item)
+            for _ in range(len(self.items) - position):
+                await asyncio.sleep(0)
+            if item is self.failing:
+                raise PageRetrievalError(f"item {position} failed")
+            return item
+        finally:
+            self.active -= 1
+
+
+async def _fetch_page(page_id):
+    """get_page_by_id stand-in returning a page titled with its ID."""
+    return Page(id=page_id, title=page_id)
+
+
+def _notion_error(adapter, status, retry_after=None):
+    """The exception notion-client raises for a Notion error response."""
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    response = httpx.Response(
+        status,
+        headers=headers,
+        json={
+            "object": "error",
+            "status": status,
+            "code": _ERROR_CODES[status],
+            "message": f"HTTP {status}",
+        },
+        request=httpx.Request("GET", "https://api.notion.com/v1/pages/page-1"),
+    )
+    try:
+        adapter.client._parse_response(response)
+    except HTTPResponseError as e:
+        return e
+    pytest.fail(f"notion-client accepted a {status} response")
+
+
+@pytest.fixture
+def auth_adapter(monkeypatch):
+    """Authentication adapter configured from the environment alone."""
+    monkeypatch.setenv("NOTION_TOKEN", "secret-token")
+    monkeypatch.setenv("NOTION_DATABASE_ID", "parent-page")
+    return AuthenticationAdapter()
+
+
+@pytest.fixture
+def fake_time():
+    """Clock starting at zero."""
+    return FakeTime()
+
+
+@pytest.fixture
+async def adapter(auth_adapter, fake_time):
+    """Uncached adapter whose rate limiter and retry backoff run on fake time."""
+    async with NotionPageRepositoryAdapter(auth_adapter, cache_ttl=0) as adapter:
+        adapter._limiter = NotionRateLimiter(
+            rate=1000, clock=fake_time, sleep=fake_time.sleep
+        )
+        adapter._sleep = fake_time.sleep
+        yield adapter
+
+
+class TestAdapterLifecycle:
+    """Test cases for the adapter's connection pool."""
+
+    async def test_async_with_closes_owned_pool(self, auth_adapter):
+        """Test that leaving an async with block closes the adapter's own pool."""
+        # Act
+        async with NotionPageRepositoryAdapter(auth_adapter) as adapter:
+            pool = adapter._http_client
+
+        # Assert
+        assert pool.is_closed
+
+    async def test_injected_pool_is_left_open(self, auth_adapter):
+        """Test that a pool passed in by the caller is not closed by the adapter."""
+        # Arrange
+        async with httpx.AsyncClient() as pool:
+            # Act
+            async with NotionPageRepositoryAdapter(auth_adapter, http_client=pool):
+                pass
+
+            # Assert
+            assert not pool.is_closed
+
+    async def test_requests_time_out_after_thirty_seconds(self, auth_adapter):
+        """Test that the pool uses the adapter's timeout, not notion-client's default."""
+        # Act
+        async with NotionPageRepositoryAdapter(auth_adapter) as adapter:
+            timeout = adapter._http_client.timeout
+
+        # Assert
+        assert timeout == httpx.Timeout(30.0)
+
+    async def test_adapters_sharing_a_pool_send_their_own_token(
+        self, auth_adapter, monkeypatch
+    ):
+        """Test that adapters on one pool each authenticate with their own token."""
+        # Arrange
+        sent = []
+
+        def handler(request):
+            sent.append(request.headers.get("Authorization"))
+            return httpx.Response(200, json={"object": "page", "id": "page-1"})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as pool:
+            first = NotionPageRepositoryAdapter(auth_adapter, http_client=pool)
+            monkeypatch.setenv("NOTION_TOKEN", "other-token")
+            second = NotionPageRepositoryAdapter(AuthenticationAdapter(), http_client=pool)
+
+            # Act
+            await first.page_exists("page-1")
+            await second.page_exists("page-1")
+
+        # Assert
+        assert sent == ["Bearer secret-token", "Bearer other-token"]
+
+
+class TestCall:
+    """Test cases for retrying Notion calls."""
+
+    async def test_sends_adapter_token(self, adapter):
+        """Test that every call is authenticated with the adapter's token."""
+        # Arrange
+        endpoint = FakeEndpoint()
+
+        # Act
+        result = await adapter._call(endpoint, page_id="page-1")
+
+        # Assert
+        assert result == endpoint.result
+        assert endpoint.calls == [{"auth": "secret-token", "page_id": "page-1"}]
+
+    @pytest.mark.parametrize("status", [429, 500, 503], ids=["rate_limited", "500", "503"])
+    async def test_retries_up_to_max_attempts(self, adapter, fake_time, status):
+        """Test that retryable responses are retried with growing backoff, then raised."""
+        # Arrange
+        errors = [_notion_error(adapter, status) for _ in range(_MAX_ATTEMPTS)]
+        endpoint = FakeEndpoint(*errors)
+
+        # Act
+        with pytest.raises(HTTPResponseError) as caught:
+            await adapter._call(endpoint)
+
+        # Assert
+        assert caught.value is errors[-1]
+        assert len(endpoint.calls) == _MAX_ATTEMPTS
+        assert len(fake_time.sleeps) == _MAX_ATTEMPTS - 1
+        for attempt, delay in enumerate(fake_time.sleeps):
+            backoff = _BASE_BACKOFF * 2 ** attempt
+            assert backoff <= delay <= backoff + _BASE_BACKOFF
+
+    async def test_returns_once_a_retry_succeeds(self, adapter):
+        """Test that the first successful attempt's response is returned."""
+        # Arrange
+        endpoint = FakeEndpoint(_notion_error(adapter, 503), RequestTimeoutError())
+
+        # Act
+        result = await adapter._call(endpoint)
+
+        # Assert
+        assert result == endpoint.result
+        assert len(endpoint.calls) == 3
+
+    @pytest.mark.parametrize(
+        "make_error",
+        [lambda adapter: _notion_error(adapter, 500), lambda adapter: RequestTimeoutError()],
+        ids=["server_error", "timeout"]
+    )
+    async def test_non_idempotent_call_is_not_retried(self, adapter, fake_time, make_error):
+        """Test that a write which may have been applied is not sent twice."""
+        # Arrange
+        error = make_error(adapter)
+        endpoint = FakeEndpoint(error)
+
+        # Act
+        with pytest.raises(type(error)):
+            await adapter._call(endpoint, idempotent=False)
+
+        # Assert
+        assert len(endpoint.calls) == 1
+        assert fake_time.sleeps == []
+
+    async def test_non_idempotent_call_is_retried_when_rate_limited(self, adapter):
+        """Test that a 429, which Notion never applied, is retried even for writes."""
+        # Arrange
+        endpoint = FakeEndpoint(_notion_error(adapter, 429), _notion_error(adapter, 429))
+
+        # Act
+        result = await adapter._call(endpoint, idempotent=False)
+
+        # Assert
+        assert result == endpoint.result
+        assert len(endpoint.calls) == 3
+
+    async def test_retry_after_defers_the_limiter(self, adapter, fake_time):
+        """Test that Retry-After holds back the rate limiter instead of backing off."""
+        # Arrange
+        endpoint = FakeEndpoint(_notion_error(adapter, 429, retry_after="2"))
+
+        # Act
+        await adapter._call(endpoint)
+
+        # Assert
+        assert fake_time.sleeps == [pytest.approx(2.0)]
+        assert len(endpoint.calls) == 2
+
+    async def test_client_error_is_raised_immediately(self, adapter, fake_time):
+        """Test that a 4xx other than 429 is not retried."""
+        # Arrange
+        error = _notion_error(adapter, 400)
+        endpoint = FakeEndpoint(error)
+
+        # Act
+        with pytest.raises(HTTPResponseError) as caught:
+            await adapter._call(endpoint)
+
+        # Assert
+        assert caught.value is error
+        assert len(endpoint.calls) == 1
+        assert fake_time.sleeps == []
+
+
+class TestPagination:
+    """Test cases for walking cursor-paginated listings."""
+
+    @pytest.fixture(autouse=True)
+    def fake_page_fetch(self, adapter, monkeypatch):
+        """Hydrate listed IDs without calling Notion."""
+        monkeypatch.setattr(adapter, "get_page_by_id", _fetch_page)
+
+    async def _ids(self, batches):
+        """Page IDs of every batch the iterator yields."""
+        return [[page.id for page in batch] async for batch in batches]
+
+    async def test_offset_spans_cursor_pages(self, adapter):
+        """Test that an offset larger than a cursor page skips into the next one."""
+        # Arrange
+        listing = FakeListing(["a", "b"], ["c", "d"], ["e"])
+
+        # Act
+        batches = await self._ids(adapter._iter_paginated_pages(listing, offset=3))
+
+        # Assert
+        assert batches == [["d"], ["e"]]
+        assert listing.cursors == [None, "1", "2"]
+
+    async def test_limit_stops_pagination(self, adapter):
+        """Test that no further cursor page is requested once the limit is met."""
+        # Arrange
+        listing = FakeListing(["a", "b"], ["c", "d"], ["e", "f"])
+
+        # Act
+        batches = await self._ids(adapter._iter_paginated_pages(listing, limit=3))
+
+        # Assert
+        assert batches == [["a", "b"], ["c"]]
+        assert listing.cursors == [None, "1"]
+
+    async def test_closing_early_cancels_prefetch(self, adapter):
+        """Test that closing the iterator cancels the next cursor page's request."""
+        # Arrange
+        listing = FakeListing(["a"], ["b"], gate=asyncio.Event())
+        batches = adapter._iter_paginated_pages(listing)
+        first = await batches.__anext__()
+        await asyncio.sleep(0)
+
+        # Act
+        await batches.aclose()
+        await asyncio.sleep(0)
+
+        # Assert
+        assert [page.id for page in first] == ["a"]
+        assert listing.cancelled == ["1"]
+
+    @pytest.mark.parametrize("limit", [None, 0], ids=["none", "zero"])
+    async def test_list_pages_without_limit_walks_every_cursor(self, adapter, limit):
+        """Test that list_pages returns the whole workspace when no limit is set."""
+        # Arrange
+        listing = FakeListing(["a", "b"], ["c"])
+        adapter.client.search = listing
+
+        # Act
+        pages = await adapter.list_pages(limit=limit)
+
+        # Assert
+        assert [page.id for page in pages] == ["a", "b", "c"]
+        assert listing.cursors == [None, "1"]
+
+
+class TestUpdatePage:
+    """Test cases for updating a page's properties and content."""
+
+    @pytest.fixture
+    def endpoints(self, adapter):
+        """Fake pages.update and block endpoints installed on the adapter's client."""
+        fakes = {
+            "update": FakeEndpoint(result=_PAGE_RESPONSE),
+            "list": FakeEndpoint(result=_BLOCKS_RESPONSE),
+            "delete": FakeEndpoint(result={}),
+            "append": FakeEndpoint(result={}),
+        }
+        adapter.client.pages.update = fakes["update"]
+        adapter.client.blocks.children.list = fakes["list"]
+        adapter.client.blocks.delete = fakes["delete"]
+        adapter.client.blocks.children.append = fakes["append"]
+        return fakes
+
+    async def test_rewrites_content_after_properties(self, adapter, endpoints):
+        """Test that new content replaces the page's blocks and is returned."""
+        # Arrange
+        page = Page(id="page-1", title="New title", content="New content")
+
+        # Act
+        updated = await adapter.update_page(page)
+
+        # Assert
+        assert updated.title == "New title"
+        assert updated.content == "New content"
+        assert [call["block_id"] for call in endpoints["delete"].calls] == ["block-1"]
+        assert len(endpoints["append"].calls) == 1
+
+    async def test_blank_content_keeps_and_returns_existing_content(self, adapter, endpoints):
+        """Test that an update without content keeps the blocks and reports them."""
+        # Arrange
+        page = Page(id="page-1", title="New title")
+
+        # Act
+        updated = await adapter.update_page(page)
+
+        # Assert
+        assert updated.title == "New title"
+        assert updated.content == "Old content"
+        assert endpoints["delete"].calls == []
+        assert endpoints["append"].calls == []
+
+    async def test_failed_property_update_leaves_content_alone(self, adapter, endpoints):
+        """Test that blocks are not touched when Notion rejects the property update."""
+        # Arrange
+        endpoints["update"].errors.append(_notion_error(adapter, 400))
+        page = Page(id="page-1", title="New title", content="New content")
+
+        # Act
+        with pytest.raises(PageUpdateError):
+            await adapter.update_page(page)
+
+        # Assert
+        assert endpoints["list"].calls == []
+        assert endpoints["delete"].calls == []
+        assert endpoints["append"].calls == []
+
+    @pytest.mark.parametrize("write", [
+        lambda adapter: adapter.update_page(Page(id="page-1", title="New title")),
+        lambda adapter: adapter.delete_page("page-1"),
+    ], ids=["update", "delete"])
+    async def test_read_during_write_is_not_left_cached(self, adapter, endpoints, write):
+        """Test that a page cached while the write was in flight is dropped afterwards."""
+        # Arrange
+        adapter._page_cache = TTLCache(60)
+        stale = Page(id="page-1", title="Old title")
+
+        async def update_racing_a_read(**kwargs):
+            adapter._page_cache.set("page-1", stale)
+            return await endpoints["update"](**kwargs)
+
+        adapter.client.pages.update = update_racing_a_read
+
+        # Act
+        await write(adapter)
+
+        # Assert
+        assert adapter._page_cache.get("page-1") is None
+
+
+class TestErrorTranslation:
+    """Test cases for turning Notion failures into domain exceptions."""
+
+    @pytest.fixture
+    def missing_page(self, adapter):
+        """Make every page and block request answer 404."""
+        for endpoint in ("retrieve", "update"):
+            setattr(adapter.client.pages, endpoint, FakeEndpoint(_notion_error(adapter, 404)))
+        adapter.client.blocks.children.list = FakeEndpoint(_notion_error(adapter, 404))
+
+    @pytest.mark.parametrize(
+        "method, expected",
+        [("get_page_by_id", None), ("page_exists", False), ("delete_page", False)],
+        ids=["get", "exists", "delete"]
+    )
+    async def test_missing_page_maps_to_not_found_result(
+        self, adapter, missing_page, method, expected
+    ):
+        """Test that a 404 becomes the method's not-found result."""
+        # Act
+        result = await getattr(adapter, method)("page-1")
+
+        # Assert
+        assert result is expected
+
+    async def test_updating_missing_page_raises_not_found(self, adapter, missing_page):
+        """Test that a 404 on update raises PageNotFoundError for that page."""
+        # Act
+        with pytest.raises(PageNotFoundError) as caught:
+            await adapter.update_page(Page(id="page-1", title="Title"))
+
+        # Assert
+        assert caught.value.page_id == "page-1"
+
+    async def test_iterator_translates_notion_errors(self, adapter):
+        """Test that a Notion error raised while iterating becomes the method's error."""
+        # Arrange
+        adapter.client.search = FakeEndpoint(_notion_error(adapter, 400))
+
+        # Act / Assert
+        with pytest.raises(PageRetrievalError, match="^Failed to list pages from Notion: "):
+            async for _ in adapter.iter_pages():
+                pass
+
+    async def test_iterator_labels_unexpected_errors(self, adapter):
+        """Test that a malformed response while iterating is reported as unexpected."""
+        # Arrange
+        adapter.client.search = FakeEndpoint(result={"results": [{"object": "page"}]})
+
+        # Act / Assert
+        with pytest.raises(PageRetrievalError, match="^Unexpected error during page listing: "):
+            async for _ in adapter.iter_pages():
+                pass
+
+    async def test_nested_error_of_another_family_is_wrapped(self, adapter, monkeypatch):
+        """Test that a database error inside create_page surfaces as PageCreationError."""
+        # Arrange
+        async def failing_lookup(database_id):
+            raise DatabaseRetrievalError("Failed to retrieve database from Notion: boom")
+
+        monkeypatch.setattr(adapter, "_get_title_property", failing_lookup)
+        page = Page(title="Task", metadata={"parent_database_id": "database-1"})
+
+        # Act / Assert
+        with pytest.raises(
+            PageCreationError,
+            match="^Failed to create page in Notion: Failed to retrieve database from Notion: boom$"
+        ):
+            await adapter.create_page(page)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2025-10-02T10:00:00.000Z",
+        "2025-12-31T23:59:59.999Z",
+        "2025-10-02T10:00:00Z",
+        "2025-10-02T10:00:00.123456Z",
+        "2025-10-02T10:00:00.000+02:00",
+        "2025-10-02",
+    ],
+    ids=["notion", "notion_max_millis", "no_fraction", "micros", "offset", "date_only"]
+)
+def test_parse_notion_timestamp_matches_fromisoformat(value):
+    """Test that the sliced fast path and the fallback agree with fromisoformat."""
+    # fromisoformat only accepts a trailing Z from Python 3.11
+    expected = datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    parsed = _parse_notion_timestamp(value)
+
+    assert parsed == expected
+    assert parsed.utcoffset() == expected.utcoffset()
+
+
+@pytest.mark.parametrize("value", [None, ""], ids=["none", "empty"])
+def test_parse_notion_timestamp_without_value(value):
+    """Test that a missing timestamp parses to None."""
+    assert _parse_notion_timestamp(value) is None
+
+
+# Bulk method -> per-item method it fans out to, with inputs for each
+_BULK_OPERATIONS = [
+    pytest.param(
+        "create_pages", "create_page", lambda i: Page(title=f"Page {i}"), id="create"
+    ),
+    pytest.param(
+        "update_pages", "update_page", lambda i: Page(id=f"page-{i}", title=f"Page {i}"), id="update"
+    ),
+    pytest.param("delete_pages", "delete_page", lambda i: f"page-{i}", id="delete"),
+]
+
+
+class TestBulkOperations:
+    """Test cases for create_pages, update_pages and delete_pages."""
+
+    @pytest.mark.parametrize("bulk, single, make_item", _BULK_OPERATIONS)
+    async def test_results_keep_input_order_with_errors_in_place(
+        self, adapter, monkeypatch, bulk, single, make_item
+    ):
+        """Test that each result, or its exception, sits at its input's position."""
+        # Arrange
+        items = [make_item(i) for i in range(5)]
+        operation = FakeOperation(items, failing=items[2])
+        monkeypatch.setattr(adapter, single, operation)
+
+        # Act
+        results = await getattr(adapter, bulk)(items)
+
+        # Assert
+        assert results[:2] == items[:2]
+        assert isinstance(results[2], PageRetrievalError)
+        assert str(results[2]) == "item 2 failed"
+        assert results[3:] == items[3:]
+
+    @pytest.mark.parametrize("bulk, single, make_item", _BULK_OPERATIONS)
+    async def test_runs_at_most_max_concurrency_at_once(
+        self, adapter, monkeypatch, bulk, single, make_item
+    ):
+        """Test that no more than max_concurrency items are in flight together."""
+        # Arrange
+        adapter.max_concurrency = 3
+        items = [make_item(i) for i in range(10)]
+        operation = FakeOperation(items)
+        monkeypatch.setattr(adapter, single, operation)
+
+        # Act
+        await getattr(adapter, bulk)(items)
+
+        # Assert
+        assert operation.peak == 3
+
+
+class TestCreateDatabasePage:
+    """Test cases for creating pages inside a database."""
+
+    @pytest.fixture
+    def create(self, adapter):
+        """Fake pages.create installed on the adapter's client."""
+        endpoint = FakeEndpoint(result=_PAGE_RESPONSE)
+        adapter.client.pages.create = endpoint
+        return endpoint
+
+    @pytest.mark.parametrize(
+        "schema, title_property",
+        [
+            ({"id": "db1", "title": [], "properties": {"Name": {"type": "title"}}}, "Name"),
+            (
+                {
+                    "id": "db1",
+                    "title": [{"text": {"content": "Tasks"}}],
+                    "properties": {
+                        "Status": {"type": "select", "select": {"options": []}},
+                        "Task": {"type": "title"},
+                    },
+                },
+                "Task",
+            ),
+            ({"id": "db1"}, "Name"),
+        ],
+        ids=["untitled", "select_without_options", "no_properties"]
+    )
+    async def test_uses_title_property_from_raw_schema(
+        self, adapter, create, schema, title_property
+    ):
+        """Test that the title goes under the database's TITLE property, however odd the schema."""
+        # Arrange
+        adapter.client.databases.retrieve = FakeEndpoint(result=schema)
+        page = Page(title="Write tests", metadata={"parent_database_id": "db1"})
+
+        # Act
+        await adapter.create_page(page)
+
+        # Assert
+        assert list(create.calls[0]["properties"]) == [title_property]
+
+    async def test_falls_back_to_name_when_schema_lookup_fails(self, adapter, create):
+        """Test that a failed schema lookup does not stop the page from being created."""
+        # Arrange
+        adapter.client.databases.retrieve = FakeEndpoint(_notion_error(adapter, 400))
+        page = Page(title="Write tests", metadata={"parent_database_id": "db1"})
+
+        # Act
+        created = await adapter.create_page(page)
+
+        # Assert
+        assert created.id == "page-1"
+        assert list(create.calls[0]["properties"]) == ["Name"]
+
+    async def test_schema_is_read_once_per_database(self, auth_adapter, fake_time):
+        """Test that repeated creates in one database reuse the title property."""
+        # Arrange
+        async with NotionPageRepositoryAdapter(auth_adapter) as adapter:
+            adapter._limiter = NotionRateLimiter(
+                rate=1000, clock=fake_time, sleep=fake_time.sleep
+            )
+            retrieve = FakeEndpoint(result={"id": "db1", "properties": {"Task": {"type": "title"}}})
+            adapter.client.databases.retrieve = retrieve
+            adapter.client.pages.create = FakeEndpoint(result=_PAGE_RESPONSE)
+
+            # Act
+            for title in ("First", "Second"):
+                await adapter.create_page(
+                    Page(title=title, metadata={"parent_database_id": "db1"})
+                )
+
+        # Assert
+        assert len(retrieve.calls) == 1
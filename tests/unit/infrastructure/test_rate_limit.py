@@ -0,0 +1,97 @@
+"""
+Unit tests for the Notion rate limiter.
+
+This module tests the token bucket behaviour of NotionRateLimiter using a
+fake clock and sleep, so no test actually waits.
+"""
+
+import pytest
+from packages.infrastructure.adapters.rate_limit import NotionRateLimiter, parse_retry_after
+
+
+class FakeTime:
+    """Clock that only moves when the limiter sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+@pytest.fixture
+def fake_time():
+    """Fake clock, passed to limiters as both their clock and their sleep."""
+    return FakeTime()
+
+
+class TestNotionRateLimiter:
+    """Test cases for NotionRateLimiter."""
+    
+    async def test_burst_does_not_wait(self, fake_time):
+        """Test that requests within the burst start immediately."""
+        limiter = NotionRateLimiter(rate=3, clock=fake_time, sleep=fake_time.sleep)
+        
+        for _ in range(3):
+            async with limiter:
+                pass
+        
+        assert fake_time.sleeps == []
+    
+    async def test_waits_for_token_after_burst(self, fake_time):
+        """Test that a request beyond the burst waits one refill interval."""
+        limiter = NotionRateLimiter(rate=4, burst=1, clock=fake_time, sleep=fake_time.sleep)
+        
+        await limiter.acquire()
+        await limiter.acquire()
+        
+        assert fake_time.sleeps == [pytest.approx(0.25)]
+    
+    async def test_tokens_refill_over_time(self, fake_time):
+        """Test that idle time refills the bucket up to its capacity."""
+        limiter = NotionRateLimiter(rate=2, burst=2, clock=fake_time, sleep=fake_time.sleep)
+        await limiter.acquire()
+        await limiter.acquire()
+        
+        fake_time.now += 10
+        await limiter.acquire()
+        await limiter.acquire()
+        
+        assert fake_time.sleeps == []
+    
+    async def test_defer_holds_back_requests(self, fake_time):
+        """Test that defer blocks the next request for the given delay."""
+        limiter = NotionRateLimiter(rate=3, clock=fake_time, sleep=fake_time.sleep)
+        
+        limiter.defer(2.5)
+        await limiter.acquire()
+        
+        assert fake_time.sleeps == [pytest.approx(2.5)]
+    
+    @pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 1, "burst": 0}])
+    def test_rejects_invalid_arguments(self, kwargs):
+        """Test that non-positive rates and bursts are rejected."""
+        with pytest.raises(ValueError):
+            NotionRateLimiter(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        ("2", 2.0),
+        ("0.5", 0.5),
+        ("-1", 0.0),
+        (None, None),
+        ("", None),
+        ("Wed, 21 Oct 2015 07:28:00 GMT", None)
+    ],
+    ids=["seconds", "fractional", "negative", "missing", "empty", "http_date"]
+)
+def test_parse_retry_after(value, expected):
+    """Test parsing of Retry-After header values given in seconds."""
+    assert parse_retry_after(value) == expected